@@ -222,7 +222,6 @@ async def _async_main(
     capability_detector: CapabilityDetector | None = None
     polling_task: asyncio.Task | None = None
     capability_refresh_task: asyncio.Task | None = None
-    command_queue_task: asyncio.Task | None = None
     web_server_task: asyncio.Task | None = None
     discovery_task: asyncio.Task | None = None
     discovery_coordinator: DiscoveryCoordinator | None = None
@@ -545,10 +544,6 @@ async def _async_main(
         )
         logger.info("Started capability refresh task")
 
-        # Start command queue processor
-        command_queue_task = loop.create_task(command_manager.process_command_queue())
-        logger.info("Started command queue processor task")
-
         # Wait for shutdown event
         await event.wait()
         logger.info("Shutdown event received, cleaning up...")
@@ -586,12 +581,6 @@ async def _async_main(
             with contextlib.suppress(asyncio.CancelledError):
                 await capability_refresh_task
 
-        # Cancel command queue task
-        if command_queue_task is not None:
-            command_queue_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await command_queue_task
-
         # Stop Discovery MQTT Handler
         if discovery_mqtt_handler is not None:
             with contextlib.suppress(Exception):
@@ -149,6 +149,10 @@ class CapabilityDetector:
         self.smarttub_client = smarttub_client
         self.topic_mapper = topic_mapper
         self._capabilities_cache: Dict[str, SpaCapabilities] = {}
+        # Bumped on every cache change; keys the memoized views below
+        self._cache_version = 0
+        self._profiles_cache: tuple[int, Dict[str, Dict[str, Any]]] | None = None
+        self._spa_ids_cache: tuple[int, tuple[str, ...]] | None = None
         self._cache_expiry_seconds = config.capability.cache_expiry_seconds
         self._refresh_interval_seconds = config.capability.refresh_interval_seconds
 
@@ -214,6 +218,7 @@ class CapabilityDetector:
 
             # Cache the results
             self._capabilities_cache[spa_id] = capabilities
+            self._cache_version += 1
 
             # Publish capability meta to MQTT if topic_mapper is available
             if self.topic_mapper:
@@ -241,6 +246,7 @@ class CapabilityDetector:
             minimal_caps = self._get_minimal_capabilities(spa_id)
             # Cache minimal capabilities to avoid repeated API calls on error
             self._capabilities_cache[spa_id] = minimal_caps
+            self._cache_version += 1
             return minimal_caps
 
     async def _detect_heater_capabilities(
@@ -492,10 +498,11 @@ class CapabilityDetector:
             self._capabilities_cache.pop(spa_id, None)
         else:
             self._capabilities_cache.clear()
+        self._cache_version += 1
 
     async def refresh_all_capabilities(self) -> None:
         """Refresh capabilities for all known spas and publish to MQTT."""
-        for spa_id in list(self._capabilities_cache.keys()):
+        for spa_id in self.snapshot_spa_ids():
             try:
                 await self.detect_capabilities(spa_id, force_refresh=True)
 
@@ -515,6 +522,43 @@ class CapabilityDetector:
             except Exception as e:
                 logger.error(f"Failed to refresh capabilities for spa {spa_id}: {e}")
 
+    def snapshot_spa_ids(self) -> tuple[str, ...]:
+        """Get the IDs of all cached spas as an immutable snapshot.
+
+        Safe to iterate while the cache is modified; the tuple is rebuilt
+        only when the capability cache changes.
+        """
+        # Read the version before building: if the cache changes meanwhile,
+        # the result is stored under the old version and rebuilt next call.
+        version = self._cache_version
+        cached = self._spa_ids_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        spa_ids = tuple(self._capabilities_cache)
+        self._spa_ids_cache = (version, spa_ids)
+        return spa_ids
+
+    def get_all_capability_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Get capability profiles for all cached spas, keyed by spa ID.
+
+        The result is rebuilt only when the capability cache changes and is
+        shared between callers, so it must not be modified. May be called
+        from threadpool handlers while detection updates the cache.
+        """
+        # Read the version before building (see snapshot_spa_ids)
+        version = self._cache_version
+        cached = self._profiles_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        profiles = {
+            spa_id: self.get_capability_profile(spa_id)
+            for spa_id in self.snapshot_spa_ids()
+        }
+        self._profiles_cache = (version, profiles)
+        return profiles
+
     def get_capability_profile(self, spa_id: str) -> Dict[str, Any]:
         """Get a simplified capability profile for UI/API consumption."""
         capabilities = self.get_cached_capabilities(spa_id)
@@ -113,6 +113,7 @@ class MQTTConfig:
     base_topic: str = "smarttub-mqtt"
     qos: int = 1
     retain: bool = True
+    timestamp_qos: int = 0  # QoS for */last_updated topics (next snapshot overwrites)
     keepalive: int = 60  # New: MQTT keepalive interval
     tls: MQTTTLSConfig = field(default_factory=MQTTTLSConfig)
 
@@ -133,6 +134,11 @@ class MQTTConfig:
         if qos > 2:
             raise ConfigError("mqtt.qos must be between 0 and 2")
         retain = _coerce_bool(data.get("retain"), "mqtt.retain", default=True)
+        timestamp_qos = _coerce_int(
+            data.get("timestamp_qos"), "mqtt.timestamp_qos", default=0, min_value=0
+        )
+        if timestamp_qos > 2:
+            raise ConfigError("mqtt.timestamp_qos must be between 0 and 2")
         keepalive = _coerce_int(
             data.get("keepalive"), "mqtt.keepalive", default=60, min_value=10
         )
@@ -146,6 +152,7 @@ class MQTTConfig:
             base_topic=base_topic,
             qos=qos,
             retain=retain,
+            timestamp_qos=timestamp_qos,
             keepalive=keepalive,
             tls=tls,
         )
@@ -157,6 +164,8 @@ class MQTTConfig:
             raise ConfigError("mqtt.base_topic cannot be empty")
         if not 0 <= self.qos <= 2:
             raise ConfigError("mqtt.qos must be between 0 and 2")
+        if not 0 <= self.timestamp_qos <= 2:
+            raise ConfigError("mqtt.timestamp_qos must be between 0 and 2")
         if self.keepalive < 10:
             raise ConfigError("mqtt.keepalive must be at least 10 seconds")
         if self.tls.enabled and not self.tls.ca_cert_path:
@@ -171,6 +180,8 @@ class WebConfig:
     auth_enabled: bool = False
     basic_auth_username: str | None = None
     basic_auth_password: str | None = None
+    # Re-check template files for changes on every render (development only)
+    template_reload: bool = False
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "WebConfig":
@@ -182,6 +193,9 @@ class WebConfig:
         )
         username = _optional_string(data.get("basic_auth_username"))
         password = _optional_string(data.get("basic_auth_password"))
+        template_reload = _coerce_bool(
+            data.get("template_reload"), "web.template_reload", default=False
+        )
         return cls(
             enabled=enabled,
             host=host,
@@ -189,6 +203,7 @@ class WebConfig:
             auth_enabled=auth_enabled,
             basic_auth_username=username,
             basic_auth_password=password,
+            template_reload=template_reload,
         )
 
     def validate(self) -> None:
@@ -206,6 +221,8 @@ class LoggingConfig:
     mqtt_forwarding: bool = False
     stdout_format: str = "json"
     file_path: str | None = None
+    # Write rotating log files under log_dir (disable for console-only setups)
+    file_enabled: bool = True
     # New: Log rotation settings
     log_dir: str = "/var/log/smarttub-mqtt"
     log_max_size_mb: int = 5
@@ -213,6 +230,10 @@ class LoggingConfig:
     log_compress: bool = True
     mqtt_log_enabled: bool = True
     mqtt_log_level: str = "warning"
+    # Forwarded log payload shaping: optional field allowlist and a cap on
+    # string value length (0 disables truncation)
+    mqtt_log_fields: tuple[str, ...] | None = None
+    mqtt_log_max_value_len: int = 256
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "LoggingConfig":
@@ -226,6 +247,9 @@ class LoggingConfig:
             _optional_string(data.get("stdout_format"), allow_empty=False) or "json"
         )
         file_path = _optional_string(data.get("file_path"))
+        file_enabled = _coerce_bool(
+            data.get("file_enabled"), "logging.file_enabled", default=True
+        )
         log_dir = (
             _optional_string(data.get("log_dir"), allow_empty=False)
             or "/var/log/smarttub-mqtt"
@@ -248,17 +272,29 @@ class LoggingConfig:
         mqtt_log_level = (
             _optional_string(data.get("mqtt_log_level"), allow_empty=False) or "warning"
         ).lower()
+        mqtt_log_fields = _coerce_str_tuple(
+            data.get("mqtt_log_fields"), "logging.mqtt_log_fields"
+        )
+        mqtt_log_max_value_len = _coerce_int(
+            data.get("mqtt_log_max_value_len"),
+            "logging.mqtt_log_max_value_len",
+            default=256,
+            min_value=0,
+        )
         return cls(
             level=level,
             mqtt_forwarding=mqtt_forwarding,
             stdout_format=stdout_format,
             file_path=file_path,
+            file_enabled=file_enabled,
             log_dir=log_dir,
             log_max_size_mb=log_max_size_mb,
             log_max_files=log_max_files,
             log_compress=log_compress,
             mqtt_log_enabled=mqtt_log_enabled,
             mqtt_log_level=mqtt_log_level,
+            mqtt_log_fields=mqtt_log_fields,
+            mqtt_log_max_value_len=mqtt_log_max_value_len,
         )
 
     def validate(self) -> None:
@@ -673,6 +709,10 @@ def _apply_env_overrides(config: AppConfig, env: Mapping[str, str]) -> None:
         config.mqtt.qos = _coerce_int(env.get("MQTT_QOS"), "MQTT_QOS", min_value=0)
     if "MQTT_RETAIN" in env:
         config.mqtt.retain = _coerce_bool(env.get("MQTT_RETAIN"), "MQTT_RETAIN")
+    if "MQTT_TIMESTAMP_QOS" in env:
+        config.mqtt.timestamp_qos = _coerce_int(
+            env.get("MQTT_TIMESTAMP_QOS"), "MQTT_TIMESTAMP_QOS", min_value=0
+        )
     if "MQTT_KEEPALIVE" in env:
         config.mqtt.keepalive = _coerce_int(
             env.get("MQTT_KEEPALIVE"), "MQTT_KEEPALIVE", min_value=10
@@ -694,6 +734,10 @@ def _apply_env_overrides(config: AppConfig, env: Mapping[str, str]) -> None:
         config.logging.stdout_format = value
     if "LOG_FILE_PATH" in env:
         config.logging.file_path = _optional_string(env.get("LOG_FILE_PATH"))
+    if "LOG_FILE_ENABLED" in env:
+        config.logging.file_enabled = _coerce_bool(
+            env.get("LOG_FILE_ENABLED"), "LOG_FILE_ENABLED"
+        )
     if "LOG_DIR" in env:
         config.logging.log_dir = env.get("LOG_DIR", "/var/log/smarttub-mqtt").strip()
     if "LOG_MAX_SIZE_MB" in env:
@@ -716,6 +760,14 @@ def _apply_env_overrides(config: AppConfig, env: Mapping[str, str]) -> None:
         config.logging.mqtt_log_level = (
             env.get("LOG_MQTT_LEVEL", "warning").strip().lower()
         )
+    if "LOG_MQTT_FIELDS" in env:
+        config.logging.mqtt_log_fields = _coerce_str_tuple(
+            env.get("LOG_MQTT_FIELDS"), "LOG_MQTT_FIELDS"
+        )
+    if "LOG_MQTT_MAX_VALUE_LEN" in env:
+        config.logging.mqtt_log_max_value_len = _coerce_int(
+            env.get("LOG_MQTT_MAX_VALUE_LEN"), "LOG_MQTT_MAX_VALUE_LEN", min_value=0
+        )
 
     if "WEB_HOST" in env:
         value = env["WEB_HOST"].strip()
@@ -742,6 +794,10 @@ def _apply_env_overrides(config: AppConfig, env: Mapping[str, str]) -> None:
         )
     if "WEB_AUTH_PASSWORD" in env:
         config.web.basic_auth_password = _optional_string(env.get("WEB_AUTH_PASSWORD"))
+    if "WEB_TEMPLATE_RELOAD" in env:
+        config.web.template_reload = _coerce_bool(
+            env.get("WEB_TEMPLATE_RELOAD"), "WEB_TEMPLATE_RELOAD"
+        )
 
     if "WEB_UI_REFRESH_INTERVAL_SECONDS" in env:
         config.web_ui.refresh_interval_seconds = _coerce_int(
@@ -933,6 +989,20 @@ def _coerce_float(
     return number
 
 
+def _coerce_str_tuple(value: Any, field_name: str) -> tuple[str, ...] | None:
+    """Coerce a list or comma-separated string to a tuple of names (None if unset)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        items = value.split(",")
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        raise ConfigError(f"{field_name} must be a list or comma-separated string")
+    names = tuple(str(item).strip() for item in items if str(item).strip())
+    return names or None
+
+
 def _coerce_bool(value: Any, field_name: str, *, default: bool | None = None) -> bool:
     if value is None or value == "":
         if default is None:
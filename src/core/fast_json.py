@@ -0,0 +1,90 @@
+"""Compact JSON encoding/decoding with optional :mod:`orjson` acceleration.
+
+``orjson`` is used when installed (``pip install smarttub-mqtt[fast]``);
+otherwise the standard library encoder is used with compact separators.
+Anything orjson refuses (e.g. integers wider than 64 bits) is re-encoded
+with the standard library, so both backends accept the same inputs.
+
+The output is not byte-identical between backends. orjson encodes
+datetimes in ISO 8601 form (``"2024-01-01T00:00:00"``) and Enums by value
+(``"a"``), whereas the stdlib path stringifies them through ``default=str``
+(``"2024-01-01 00:00:00"``, ``"E.A"``). Non-string dict keys become strings
+in both.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # Optional C-accelerated encoder
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this single type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+_COMPACT_SEPARATORS = (",", ":")
+
+if HAS_ORJSON:
+    # Stringify int/float/bool/None dict keys like the stdlib encoder does
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _ORJSON_PRETTY_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes.
+
+    Unknown types are stringified (``default=str``), matching the behaviour
+    of the log and audit forwarders.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:  # orjson.JSONEncodeError; stdlib handles the rest
+            pass
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS, default=str).encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes indented by two spaces."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_PRETTY_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize ``obj`` to a compact JSON ``str``."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode(
+                "utf-8"
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS, default=str)
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Deserialize JSON from ``str`` or UTF-8 ``bytes``."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = [
+    "HAS_ORJSON",
+    "JSONDecodeError",
+    "dumps",
+    "dumps_pretty",
+    "dumps_str",
+    "loads",
+]
@@ -5,13 +5,17 @@ This module provides a custom rotating file handler that:
 - Compresses rotated logs to ZIP format
 - Keeps only ONE ZIP per log type (deletes old ZIPs before creating new)
 - Manages three separate log files: mqtt.log, webui.log, smarttub.log
+- Writes each file from a background thread so logging calls never block on disk I/O
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import zipfile
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
 from logging.handlers import RotatingFileHandler as StdRotatingFileHandler
 
 
@@ -129,13 +133,40 @@ class ZipRotatingFileHandler(StdRotatingFileHandler):
             self.stream = self._open()
 
 
+class BackgroundFileHandler(QueueHandler):
+    """Queue records in the caller and write them to a file handler from a thread.
+
+    The logging call only formats the message and enqueues the record; a
+    QueueListener thread performs the write(), rotation and ZIP compression.
+    The listener is stopped (draining pending records) on close() and at exit.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self._listener = QueueListener(self.queue, target, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._stop_listener)
+
+    def _stop_listener(self) -> None:
+        if self._listener._thread is not None:
+            self._listener.stop()
+
+    def close(self) -> None:
+        self._stop_listener()
+        atexit.unregister(self._stop_listener)
+        self.target.close()
+        super().close()
+
+
 def setup_file_logging(
     log_dir: str | Path,
     log_max_size_mb: int = 5,
     log_max_files: int = 5,
     log_compress: bool = True,
     log_level: int = logging.INFO,
-) -> dict[str, ZipRotatingFileHandler]:
+    background: bool = True,
+) -> dict[str, logging.Handler]:
     """Set up file logging with rotation and ZIP compression for all log types.
 
     Creates three separate log files:
@@ -149,6 +180,7 @@ def setup_file_logging(
         log_max_files: Ignored (we always keep 1 ZIP per type)
         log_compress: Whether to compress rotated logs
         log_level: Minimum log level
+        background: Write from a background thread (see BackgroundFileHandler)
 
     Returns:
         Dictionary mapping log type to handler instance
@@ -158,7 +190,7 @@ def setup_file_logging(
 
     max_bytes = log_max_size_mb * 1024 * 1024  # Convert MB to bytes
 
-    handlers: dict[str, ZipRotatingFileHandler] = {}
+    handlers: dict[str, logging.Handler] = {}
     log_types = ["mqtt", "webui", "smarttub"]
 
     for log_type in log_types:
@@ -179,9 +211,14 @@ def setup_file_logging(
         )
         handler.setFormatter(formatter)
 
-        handlers[log_type] = handler
+        if background:
+            queued = BackgroundFileHandler(handler)
+            queued.setLevel(log_level)
+            handlers[log_type] = queued
+        else:
+            handlers[log_type] = handler
 
     return handlers
 
 
-__all__ = ["ZipRotatingFileHandler", "setup_file_logging"]
+__all__ = ["BackgroundFileHandler", "ZipRotatingFileHandler", "setup_file_logging"]
@@ -10,14 +10,18 @@ tasks.
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import socket
+import sys
+import threading
 import time
 import types
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urlparse
 
+from src.core import fast_json
 from src.core.config_loader import AppConfig
 
 try:  # pragma: no cover - fallback when dependency missing
@@ -39,13 +43,87 @@ except ImportError:
     ErrorCategory = None  # type: ignore
     ErrorSeverity = None  # type: ignore
 
+# URL schemes that imply the TLS default port
+_TLS_SCHEMES: frozenset[str] = frozenset(("mqtts", "ssl", "tls"))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_endpoint(broker_url: str) -> tuple[str, int]:
+    """Split a broker URL (or bare ``host[:port]``) into host and port."""
+    parsed = urlparse(broker_url or "")
+
+    if parsed.scheme:
+        host = parsed.hostname or "localhost"
+        if parsed.port is not None:
+            port = parsed.port
+        elif parsed.scheme in _TLS_SCHEMES:
+            port = 8883
+        else:
+            port = 1883
+        return host, port
+
+    # Fallback for host[:port] without scheme
+    host_port = broker_url.split(":", maxsplit=1)
+    host = host_port[0] if host_port[0] else "localhost"
+    if len(host_port) == 2:
+        try:
+            port = int(host_port[1])
+        except ValueError:
+            port = 1883
+    else:
+        port = 1883
+    return host, port
+
 
 class MQTTBrokerClient:
     """Wrapper that configures and manages a paho-mqtt client instance."""
 
+    # Every instance attribute must be declared here; there is no __dict__.
+    __slots__ = (
+        "_config",
+        "_logger",
+        "_error_tracker",
+        "_client",
+        "_cached_client_id",
+        "_has_reconnect_delay_set",
+        "_has_loop_start",
+        "_has_loop_stop",
+        "_has_disconnect",
+        "_probed_client",
+        "_loop_started",
+        "_rc_min",
+        "_rc_max",
+        "_connected",
+        "_topic_callbacks",
+        "_subscription_qos",
+        "_resubscribe_list",
+        "_connect_time",
+        "_connect_monotonic",
+        "_disconnect_time",
+        "_reconnect_count",
+        "_last_error",
+        "_last_error_time",
+        "_error_count",
+        "_meta_topic",
+        "_errors_meta_topic",
+        "_progress_topic",
+        "_broker_url",
+        "_client_id",
+        "_keepalive",
+        "_tls_enabled",
+        "_qos_default",
+        "_last_meta_payload",
+        "_last_errors_snapshot",
+        "_errors_dirty",
+        "_errors_flush_timer",
+        "_errors_lock",
+    )
+
     DEFAULT_RECONNECT_MIN_SECONDS = 1
     DEFAULT_RECONNECT_MAX_SECONDS = 60
     DEFAULT_KEEPALIVE_SECONDS = 60
+    SOCKET_SNDBUF_BYTES = 256 * 1024
+    ERRORS_META_FLUSH_SECONDS = 5.0
 
     def __init__(
         self,
@@ -58,22 +136,82 @@ class MQTTBrokerClient:
         self._logger = logger or logging.getLogger("smarttub.mqtt.broker")
         self._error_tracker = error_tracker
         self._client: Any | None = None
+        self._cached_client_id: str | None = None
+        # Optional paho capabilities, probed once per client (see _probe_client)
+        self._has_reconnect_delay_set = False
+        self._has_loop_start = False
+        self._has_loop_stop = False
+        self._has_disconnect = False
+        self._probed_client: Any | None = None
         self._loop_started = False
-        self._current_backoff = self._reconnect_min
+
+        # Reconnect backoff bounds (seconds), fixed for the client lifetime
+        self._rc_min: int = max(
+            1,
+            int(
+                getattr(
+                    config.mqtt,
+                    "reconnect_min_seconds",
+                    self.DEFAULT_RECONNECT_MIN_SECONDS,
+                )
+            ),
+        )
+        self._rc_max: int = max(
+            self._rc_min,
+            int(
+                getattr(
+                    config.mqtt,
+                    "reconnect_max_seconds",
+                    self.DEFAULT_RECONNECT_MAX_SECONDS,
+                )
+            ),
+        )
         self._connected = False
 
-        # Topic callback registry for supporting multiple subscriptions
-        self._topic_callbacks: dict[str, callable] = {}
+        # Topic callback registry for supporting multiple subscriptions,
+        # mapping pattern -> (callback, binary, pattern_parts, specificity).
+        # Patterns are split (and their levels interned) once at subscribe time.
+        self._topic_callbacks: dict[
+            str, tuple[callable, bool, tuple[str, ...], int]
+        ] = {}
+        # (topic, qos) pairs replayed as one SUBSCRIBE packet on reconnect
+        self._subscription_qos: dict[str, int] = {}
+        self._resubscribe_list: list[tuple[str, int]] = []
 
         # Meta-topic tracking (T055)
+        # Wall-clock times are only used for ISO formatting; uptime is
+        # measured on the monotonic clock so NTP adjustments do not skew it.
         self._connect_time: float | None = None
+        self._connect_monotonic: float | None = None
         self._disconnect_time: float | None = None
         self._reconnect_count: int = 0
         self._last_error: str | None = None
         self._last_error_time: float | None = None
         self._error_count: int = 0
-        self._meta_topic: str | None = None
-        self._errors_meta_topic: str | None = None  # T058
+
+        # Connection settings and meta topics are invariant for the lifetime
+        # of the client, so resolve them once instead of on every publish.
+        mqtt_config = config.mqtt
+        base_topic = (mqtt_config.base_topic or "smarttub-mqtt").rstrip("/")
+        self._meta_topic = f"{base_topic}/meta/mqtt"
+        self._errors_meta_topic = f"{base_topic}/meta/errors"  # T058
+        self._progress_topic = f"{base_topic}/meta/discovery/progress"  # T059
+        self._broker_url: str = mqtt_config.broker_url
+        self._client_id: str = getattr(mqtt_config, "client_id", "smarttub-mqtt")
+        self._keepalive: int = getattr(
+            mqtt_config, "keepalive", self.DEFAULT_KEEPALIVE_SECONDS
+        )
+        self._tls_enabled: bool = getattr(
+            getattr(mqtt_config, "tls", None), "enabled", False
+        )
+        self._qos_default: int = mqtt_config.qos
+        # Last published meta payloads, used to skip no-op retained publishes
+        self._last_meta_payload: bytes | None = None
+        self._last_errors_snapshot: tuple[Any, Any] | None = None
+        # Deferred meta/errors publishing after publish failures
+        self._errors_dirty = False
+        self._errors_flush_timer: threading.Timer | None = None
+        self._errors_lock = threading.Lock()
 
     # ---------------------------------------------------------------------
     # Public API
@@ -83,18 +221,16 @@ class MQTTBrokerClient:
 
         client = self._client or self._create_client()
         self._client = client
+        if self._probed_client is not client:
+            self._probe_client(client)
 
-        if hasattr(client, "reconnect_delay_set"):
+        if self._has_reconnect_delay_set:
             client.reconnect_delay_set(
-                min_delay=self._reconnect_min, max_delay=self._reconnect_max
+                min_delay=self._rc_min, max_delay=self._rc_max
             )
 
-        host, port = self._resolve_endpoint(self._mqtt_config.broker_url)
-        keepalive = getattr(
-            self._mqtt_config, "keepalive_seconds", self.DEFAULT_KEEPALIVE_SECONDS
-        )
-
-        self._current_backoff = self._reconnect_min
+        host, port = self._resolve_endpoint(self._broker_url)
+        keepalive = self._keepalive
 
         # Try to connect and log helpful diagnostics on failure.
         try:
@@ -112,27 +248,37 @@ class MQTTBrokerClient:
             )
             raise
 
-        if not self._loop_started and hasattr(client, "loop_start"):
+        if not self._loop_started and self._has_loop_start:
             client.loop_start()
             self._loop_started = True
 
     def disconnect(self) -> None:
         """Disconnect gracefully from the MQTT broker."""
 
+        with self._errors_lock:
+            if self._errors_flush_timer is not None:
+                self._errors_flush_timer.cancel()
+                self._errors_flush_timer = None
+
         if not self._client:
             return
 
-        if self._loop_started and hasattr(self._client, "loop_stop"):
+        if self._loop_started and self._has_loop_stop:
             try:
                 self._client.loop_stop()
             finally:
                 self._loop_started = False
 
-        if hasattr(self._client, "disconnect"):
+        if self._has_disconnect:
             self._client.disconnect()
 
         self._connected = False
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the broker connection is currently up (tracked by callbacks)."""
+        return self._connected
+
     def publish(
         self,
         topic: str,
@@ -146,127 +292,196 @@ class MQTTBrokerClient:
         if not self._client:
             raise RuntimeError("MQTT client is not connected")
 
-        publish_kwargs: dict[str, Any] = {}
-        if qos is not None:
-            publish_kwargs["qos"] = qos
-        if retain is not None:
-            publish_kwargs["retain"] = retain
-
-        # Attempt publish and log details to assist debugging (topic, payload size, qos, retain)
+        # Attempt publish; details (topic, payload size, qos, retain) are logged at DEBUG
         try:
-            # Send the publish through the underlying client
-            result = self._client.publish(topic, payload, **publish_kwargs)
+            # Send the publish through the underlying client. Unset options
+            # fall back to paho's own defaults (QoS 0, not retained) without
+            # building a kwargs dict per call.
+            result = self._client.publish(
+                topic,
+                payload,
+                0 if qos is None else qos,
+                False if retain is None else retain,
+            )
 
-            # Compute payload length defensively
-            try:
-                payload_len = len(payload) if payload is not None else 0
-            except Exception:
-                payload_len = None
+            if self._is_enabled_for(logging.DEBUG):
+                if payload is None:
+                    payload_len = 0
+                elif isinstance(payload, (bytes, bytearray, str)):
+                    payload_len = len(payload)
+                else:
+                    payload_len = None
 
-            self._logger.info(
-                "mqtt-publish",
-                extra={
-                    "topic": topic,
-                    "payload_len": payload_len,
-                    "qos": publish_kwargs.get("qos"),
-                    "retain": publish_kwargs.get("retain"),
-                },
-            )
+                self._logger.debug(
+                    "mqtt-publish topic=%s payload_len=%s qos=%s retain=%s",
+                    topic,
+                    payload_len,
+                    qos,
+                    retain,
+                )
 
             return result
         except Exception as exc:  # pragma: no cover - runtime networking
-            # Track publish errors (T055)
-            self._last_error = f"Publish failed: {str(exc)}"
-            self._last_error_time = time.time()
-            self._error_count += 1
-
-            # Track in Error Tracker if available (T058)
-            if self._error_tracker and HAS_ERROR_TRACKER:
-                self._error_tracker.track_error(
-                    category=ErrorCategory.MQTT_PUBLISH,
-                    message=f"Failed to publish to topic {topic}: {str(exc)}",
-                    severity=ErrorSeverity.ERROR,
-                    error_code="MQTT_PUBLISH_FAILED",
-                    details={"topic": topic},
-                )
-                # Publish updated error meta (avoid recursion by checking topic)
-                if not topic.endswith("/meta/errors"):
-                    try:
-                        self.publish_meta_errors()
-                    except Exception:
-                        pass  # Avoid cascading errors
+            self._track_publish_failure(topic, exc)
+            raise
 
-            self._logger.error(
-                "mqtt-publish-failed", exc_info=exc, extra={"topic": topic}
+    def publish_many(self, messages: Any) -> int:
+        """Publish a batch of messages in one tight loop.
+
+        Args:
+            messages: Iterable of objects with ``topic``, ``payload``, ``qos``
+                and ``retain`` attributes (e.g. ``MQTTMessage``)
+
+        Returns:
+            Number of messages handed to the paho client. A failed message is
+            tracked like in :meth:`publish` and does not stop the batch.
+        """
+        if not self._client:
+            raise RuntimeError("MQTT client is not connected")
+
+        client_publish = self._client.publish
+        sent = 0
+        for msg in messages:
+            try:
+                client_publish(msg.topic, msg.payload, msg.qos, msg.retain)
+                sent += 1
+            except Exception as exc:  # pragma: no cover - runtime networking
+                self._track_publish_failure(msg.topic, exc)
+
+        if self._is_enabled_for(logging.DEBUG):
+            self._logger.debug("mqtt-publish-batch count=%s", sent)
+        return sent
+
+    def _track_publish_failure(self, topic: str, exc: Exception) -> None:
+        """Record a failed publish in the connection and error tracker state."""
+        # Track publish errors (T055)
+        self._last_error = f"Publish failed: {str(exc)}"
+        self._last_error_time = time.time()
+        self._error_count += 1
+
+        # Track in Error Tracker if available (T058)
+        if self._error_tracker and HAS_ERROR_TRACKER:
+            self._error_tracker.track_error(
+                category=ErrorCategory.MQTT_PUBLISH,
+                message=f"Failed to publish to topic {topic}: {str(exc)}",
+                severity=ErrorSeverity.ERROR,
+                error_code="MQTT_PUBLISH_FAILED",
+                details={"topic": topic},
             )
-            raise
+            # Defer the meta/errors update so a broker outage does not
+            # turn every failed publish into another publish attempt.
+            if topic != self._errors_meta_topic:
+                self._mark_errors_dirty()
 
-    def subscribe(self, topic: str, callback: callable, *, qos: int = 1) -> None:
+        self._logger.error("mqtt-publish-failed topic=%s", topic, exc_info=exc)
+
+    def subscribe(
+        self, topic: str, callback: callable, *, qos: int = 1, binary: bool = False
+    ) -> None:
         """Subscribe to an MQTT topic with a callback function.
 
         Args:
             topic: MQTT topic to subscribe to (supports wildcards like +, #)
             callback: Function to call when message is received (signature: callback(topic, payload))
             qos: Quality of Service level
+            binary: Pass the raw ``bytes`` payload instead of decoding it as UTF-8
         """
         if not self._client:
             raise RuntimeError("MQTT client is not connected")
 
-        # Register callback for this topic pattern
-        self._topic_callbacks[topic] = callback
+        self._register_subscription(topic, callback, qos, binary)
+        self._client.subscribe(topic, qos)
+        if self._is_enabled_for(logging.DEBUG):
+            self._logger.debug("Subscribed to MQTT topic: %s", topic)
 
-        # Set up global message handler if not already set
-        if not hasattr(self._client, "_message_handler_installed"):
+    def subscribe_many(
+        self,
+        topics: list[str] | tuple[str, ...],
+        callback: callable,
+        *,
+        qos: int = 1,
+        binary: bool = False,
+    ) -> None:
+        """Subscribe several topics to one callback with a single SUBSCRIBE packet.
 
-            def on_message(client, userdata, message):
+        Args:
+            topics: MQTT topics to subscribe to (supports wildcards like +, #)
+            callback: Function to call when message is received (signature: callback(topic, payload))
+            qos: Quality of Service level applied to every topic
+            binary: Pass the raw ``bytes`` payload instead of decoding it as UTF-8
+        """
+        if not self._client:
+            raise RuntimeError("MQTT client is not connected")
+        if not topics:
+            return
+
+        for topic in topics:
+            self._register_subscription(topic, callback, qos, binary)
+        self._client.subscribe([(topic, qos) for topic in topics])
+        if self._is_enabled_for(logging.DEBUG):
+            self._logger.debug("Subscribed to %d MQTT topics", len(topics))
+
+    def _register_subscription(
+        self, topic: str, callback: callable, qos: int, binary: bool
+    ) -> None:
+        """Record a topic callback and install the shared message dispatcher."""
+        # Register callback for this topic pattern
+        pattern_parts = tuple(sys.intern(part) for part in topic.split("/"))
+        # Count non-wildcard parts as specificity score
+        specificity = sum(1 for part in pattern_parts if part not in ("+", "#"))
+        self._topic_callbacks[topic] = (callback, binary, pattern_parts, specificity)
+        self._subscription_qos[topic] = qos
+        self._resubscribe_list = list(self._subscription_qos.items())
+
+        # Install the shared message dispatcher once per paho client
+        if not getattr(self._client, "_message_handler_installed", False):
+            self._client.on_message = self._on_message
+            self._client._message_handler_installed = True
+
+    def _on_message(self, client: Any, userdata: Any, message: Any) -> None:
+        """Dispatch an inbound message to the most specific matching callback."""
+        try:
+            received_topic = message.topic
+            topic_parts = tuple(received_topic.split("/"))
+
+            # Find the most specific matching callback (more non-wildcard
+            # levels = more specific). Patterns that cannot beat the current
+            # best are skipped before matching.
+            best_callback = None
+            best_binary = False
+            best_specificity = -1
+
+            for cb, binary, pattern_parts, specificity in (
+                self._topic_callbacks.values()
+            ):
+                if specificity > best_specificity and self._parts_match(
+                    pattern_parts, topic_parts
+                ):
+                    best_callback = cb
+                    best_binary = binary
+                    best_specificity = specificity
+
+            if best_callback:
+                # Only decode for subscribers that want text payloads
+                payload = message.payload
+                if not best_binary and isinstance(payload, (bytes, bytearray)):
+                    payload = payload.decode("utf-8")
                 try:
-                    payload = (
-                        message.payload.decode("utf-8")
-                        if isinstance(message.payload, bytes)
-                        else message.payload
-                    )
-                    received_topic = message.topic
-
-                    # Find the most specific matching callback
-                    # Sort by pattern specificity (more path parts = more specific)
-                    best_callback = None
-                    best_specificity = -1
-
-                    for pattern, cb in self._topic_callbacks.items():
-                        if self._topic_matches(pattern, received_topic):
-                            # Count non-wildcard parts as specificity score
-                            specificity = sum(
-                                1
-                                for part in pattern.split("/")
-                                if part not in ("+", "#")
-                            )
-                            if specificity > best_specificity:
-                                # Prefer more specific patterns
-                                best_callback = cb
-                                best_specificity = specificity
-
-                    if best_callback:
-                        try:
-                            best_callback(received_topic, payload)
-                        except Exception as e:
-                            self._logger.error(
-                                f"Error in MQTT callback for topic {received_topic}: {e}",
-                                exc_info=True,
-                            )
-                    else:
-                        self._logger.debug(
-                            f"No callback matched for topic: {received_topic}"
-                        )
+                    best_callback(received_topic, payload)
                 except Exception as e:
                     self._logger.error(
-                        f"Error in MQTT message handler: {e}", exc_info=True
+                        "Error in MQTT callback for topic %s: %s",
+                        received_topic,
+                        e,
+                        exc_info=True,
                     )
-
-            self._client.on_message = on_message
-            self._client._message_handler_installed = True
-
-        self._client.subscribe(topic, qos)
-        self._logger.debug(f"Subscribed to MQTT topic: {topic}")
+            else:
+                if self._is_enabled_for(logging.DEBUG):
+                    self._logger.debug(
+                        "No callback matched for topic: %s", received_topic
+                    )
+        except Exception as e:
+            self._logger.error("Error in MQTT message handler: %s", e, exc_info=True)
 
     def _topic_matches(self, pattern: str, topic: str) -> bool:
         """Check if a topic matches a subscription pattern with wildcards.
@@ -278,13 +493,20 @@ class MQTTBrokerClient:
         Returns:
             True if topic matches pattern
         """
-        pattern_parts = pattern.split("/")
-        topic_parts = topic.split("/")
-
         # Quick check for exact match
         if pattern == topic:
             return True
 
+        return self._parts_match(tuple(pattern.split("/")), tuple(topic.split("/")))
+
+    @staticmethod
+    def _parts_match(
+        pattern_parts: tuple[str, ...], topic_parts: tuple[str, ...]
+    ) -> bool:
+        """Match pre-split topic levels against pre-split pattern levels."""
+        if pattern_parts == topic_parts or pattern_parts == ("#",):
+            return True
+
         # Check wildcard patterns
         i = 0
         j = 0
@@ -311,25 +533,24 @@ class MQTTBrokerClient:
         Publishes comprehensive connection status, interface information,
         and error tracking to {base_topic}/meta/mqtt as JSON.
         """
-        if not self._meta_topic:
-            base_topic = (self._mqtt_config.base_topic or "smarttub-mqtt").rstrip("/")
-            self._meta_topic = f"{base_topic}/meta/mqtt"
-
         # Get version information
         from src.core.version import get_version_info
 
         version_info = get_version_info()
 
         # Build meta payload
-        now = time.time()
-        uptime = int(now - self._connect_time) if self._connect_time else 0
+        uptime = (
+            int(time.monotonic() - self._connect_monotonic)
+            if self._connect_monotonic is not None
+            else 0
+        )
 
         meta_data = {
             "status": "connected"
             if self._connected
             else ("error" if self._last_error else "disconnected"),
-            "broker": self._mqtt_config.broker_url,
-            "client_id": getattr(self._mqtt_config, "client_id", "smarttub-mqtt"),
+            "broker": self._broker_url,
+            "client_id": self._client_id,
             "versions": {
                 "smarttub_mqtt": version_info["smarttub_mqtt"],
                 "python_smarttub": version_info["python_smarttub"],
@@ -344,13 +565,9 @@ class MQTTBrokerClient:
             "interface": {
                 "version": "1.0.0",  # Could be extracted from __version__ later
                 "protocol": "MQTT 3.1.1",  # paho-mqtt default
-                "tls_enabled": getattr(
-                    getattr(self._mqtt_config, "tls", None), "enabled", False
-                ),
-                "keepalive": getattr(
-                    self._mqtt_config, "keepalive", self.DEFAULT_KEEPALIVE_SECONDS
-                ),
-                "qos_default": self._mqtt_config.qos,
+                "tls_enabled": self._tls_enabled,
+                "keepalive": self._keepalive,
+                "qos_default": self._qos_default,
             },
             "errors": {
                 "last_error": self._last_error,
@@ -360,10 +577,14 @@ class MQTTBrokerClient:
         }
 
         try:
-            payload = json.dumps(meta_data, indent=None)
+            payload = fast_json.dumps(meta_data)
+            if payload == self._last_meta_payload:
+                # Retained value on the broker is already up to date
+                return
             self.publish(self._meta_topic, payload, qos=1, retain=True)
+            self._last_meta_payload = payload
         except Exception as e:
-            self._logger.warning(f"Failed to publish MQTT meta topic: {e}")
+            self._logger.warning("Failed to publish MQTT meta topic: %s", e)
 
     @staticmethod
     def _format_timestamp(ts: float | None) -> str | None:
@@ -385,15 +606,17 @@ class MQTTBrokerClient:
         if not self._error_tracker:
             return  # No error tracker available
 
-        if not self._errors_meta_topic:
-            base_topic = (self._mqtt_config.base_topic or "smarttub-mqtt").rstrip("/")
-            self._errors_meta_topic = f"{base_topic}/meta/errors"
-
         try:
             # Get error summary from tracker
             error_summary = self._error_tracker.get_error_summary()
             subsystem_status = self._error_tracker.get_subsystem_status()
 
+            # Skip the publish when nothing changed since the last one; the
+            # timestamp alone is not worth a retained update.
+            snapshot = (error_summary, subsystem_status)
+            if snapshot == self._last_errors_snapshot:
+                return
+
             # Build comprehensive error meta payload
             error_meta = {
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -401,11 +624,41 @@ class MQTTBrokerClient:
                 "subsystems": subsystem_status,
             }
 
-            payload = json.dumps(error_meta, indent=None)
+            payload = fast_json.dumps(error_meta)
             self.publish(self._errors_meta_topic, payload, qos=1, retain=True)
+            self._last_errors_snapshot = snapshot
+            self._errors_dirty = False
 
         except Exception as e:
-            self._logger.warning(f"Failed to publish error meta topic: {e}")
+            self._logger.warning("Failed to publish error meta topic: %s", e)
+
+    def _mark_errors_dirty(self) -> None:
+        """Schedule a single deferred meta/errors publish.
+
+        Repeated calls within ``ERRORS_META_FLUSH_SECONDS`` coalesce into one
+        publish, which bounds the meta/errors rate during broker outages.
+        """
+        with self._errors_lock:
+            self._errors_dirty = True
+            if self._errors_flush_timer is not None:
+                return
+            timer = threading.Timer(
+                self.ERRORS_META_FLUSH_SECONDS, self._flush_errors_meta
+            )
+            timer.daemon = True
+            self._errors_flush_timer = timer
+        timer.start()
+
+    def _flush_errors_meta(self) -> None:
+        with self._errors_lock:
+            self._errors_flush_timer = None
+            if not self._errors_dirty:
+                return
+            self._errors_dirty = False
+        try:
+            self.publish_meta_errors()
+        except Exception:
+            pass  # Avoid cascading errors
 
     def publish_discovery_progress(self, progress_data: dict) -> None:
         """Publish discovery progress to meta/discovery/progress topic (T059).
@@ -419,9 +672,6 @@ class MQTTBrokerClient:
         Args:
             progress_data: Progress snapshot from DiscoveryProgressTracker
         """
-        base_topic = (self._mqtt_config.base_topic or "smarttub-mqtt").rstrip("/")
-        progress_topic = f"{base_topic}/meta/discovery/progress"
-
         try:
             # Add timestamp to progress data
             progress_with_timestamp = {
@@ -429,12 +679,12 @@ class MQTTBrokerClient:
                 **progress_data,
             }
 
-            payload = json.dumps(progress_with_timestamp, indent=None)
+            payload = fast_json.dumps(progress_with_timestamp)
             # Use QoS 0 for frequent progress updates, retain last state
-            self.publish(progress_topic, payload, qos=0, retain=True)
+            self.publish(self._progress_topic, payload, qos=0, retain=True)
 
         except Exception as e:
-            self._logger.warning(f"Failed to publish discovery progress: {e}")
+            self._logger.warning("Failed to publish discovery progress: %s", e)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -443,32 +693,6 @@ class MQTTBrokerClient:
     def _mqtt_config(self) -> Any:
         return self._config.mqtt
 
-    @property
-    def _reconnect_min(self) -> int:
-        return max(
-            1,
-            int(
-                getattr(
-                    self._mqtt_config,
-                    "reconnect_min_seconds",
-                    self.DEFAULT_RECONNECT_MIN_SECONDS,
-                )
-            ),
-        )
-
-    @property
-    def _reconnect_max(self) -> int:
-        return max(
-            self._reconnect_min,
-            int(
-                getattr(
-                    self._mqtt_config,
-                    "reconnect_max_seconds",
-                    self.DEFAULT_RECONNECT_MAX_SECONDS,
-                )
-            ),
-        )
-
     def _create_client(self) -> Any:
         client_ctor = getattr(mqtt, "Client", None)
         if client_ctor is None:
@@ -506,6 +730,8 @@ class MQTTBrokerClient:
         except TypeError:  # pragma: no cover - compatibility path
             client = client_ctor(client_id=effective_client_id)
 
+        self._probe_client(client)
+
         if hasattr(client, "enable_logger"):
             client.enable_logger(self._logger)
 
@@ -521,33 +747,24 @@ class MQTTBrokerClient:
 
         client.on_connect = self._handle_connect
         client.on_disconnect = self._handle_disconnect
+        client.on_connect_fail = self._handle_connect_fail
+        # Applied on every (re)connect, including paho's automatic reconnects
+        client.on_socket_open = self._on_socket_open
 
         return client
 
-    def _resolve_endpoint(self, broker_url: str) -> tuple[str, int]:
-        parsed = urlparse(broker_url or "")
-
-        if parsed.scheme:
-            host = parsed.hostname or "localhost"
-            if parsed.port is not None:
-                port = parsed.port
-            elif parsed.scheme in {"mqtts", "ssl", "tls"}:
-                port = 8883
-            else:
-                port = 1883
-            return host, port
+    def _probe_client(self, client: Any) -> None:
+        """Record which optional paho methods ``client`` provides."""
+        self._has_reconnect_delay_set = hasattr(client, "reconnect_delay_set")
+        self._has_loop_start = hasattr(client, "loop_start")
+        self._has_loop_stop = hasattr(client, "loop_stop")
+        self._has_disconnect = hasattr(client, "disconnect")
+        self._probed_client = client
 
-        # Fallback for host[:port] without scheme
-        host_port = broker_url.split(":", maxsplit=1)
-        host = host_port[0] if host_port[0] else "localhost"
-        if len(host_port) == 2:
-            try:
-                port = int(host_port[1])
-            except ValueError:
-                port = 1883
-        else:
-            port = 1883
-        return host, port
+    def _resolve_endpoint(self, broker_url: str) -> tuple[str, int]:
+        # The broker URL never changes between reconnects, so the parse is
+        # cached at module level.
+        return _parse_endpoint(broker_url)
 
     # ------------------------------------------------------------------
     # Callbacks
@@ -555,30 +772,15 @@ class MQTTBrokerClient:
     def _handle_connect(
         self, client: Any, userdata: Any, flags: Any, reason_code: Any, properties: Any
     ) -> None:
-        self._current_backoff = self._reconnect_min
         self._connected = True
         self._connect_time = time.time()
+        self._connect_monotonic = time.monotonic()
 
         # Increment reconnect count (first connect is 0, subsequent reconnects are 1, 2, ...)
         if self._disconnect_time is not None:
             self._reconnect_count += 1
 
-        # Try to extract a stable client identifier for debugging (paho exposes
-        # either `client_id` or `_client_id`, often bytes). Decode if needed.
-        client_id = None
-        try:
-            raw_id = getattr(client, "client_id", None) or getattr(
-                client, "_client_id", None
-            )
-            if isinstance(raw_id, (bytes, bytearray)):
-                try:
-                    client_id = raw_id.decode("utf-8", errors="ignore")
-                except Exception:
-                    client_id = str(raw_id)
-            else:
-                client_id = str(raw_id) if raw_id is not None else None
-        except Exception:
-            client_id = None
+        client_id = self._extract_client_id(client)
 
         self._logger.info(
             "Connected to MQTT broker",
@@ -590,23 +792,23 @@ class MQTTBrokerClient:
             },
         )
 
-        # Resubscribe to all topics after (re)connect
-        if self._topic_callbacks:
+        # Resubscribe to all topics after (re)connect, batched into a
+        # single SUBSCRIBE packet
+        if self._resubscribe_list:
             self._logger.info(
-                f"Resubscribing to {len(self._topic_callbacks)} MQTT topics after connect"
+                "Resubscribing to %d MQTT topics after connect",
+                len(self._resubscribe_list),
             )
-            for topic in self._topic_callbacks.keys():
-                try:
-                    client.subscribe(topic, qos=1)
-                    self._logger.debug(f"Resubscribed to: {topic}")
-                except Exception as e:
-                    self._logger.error(f"Failed to resubscribe to {topic}: {e}")
+            try:
+                client.subscribe(self._resubscribe_list)
+            except Exception as e:
+                self._logger.error("Failed to resubscribe to MQTT topics: %s", e)
 
         # Publish meta/mqtt topic (T055)
         try:
             self.publish_meta_mqtt()
         except Exception as e:
-            self._logger.warning(f"Failed to publish MQTT meta on connect: {e}")
+            self._logger.warning("Failed to publish MQTT meta on connect: %s", e)
 
     def _handle_disconnect(
         self,
@@ -616,27 +818,14 @@ class MQTTBrokerClient:
         reason_code: Any,
         properties: Any,
     ) -> None:
-        self._disconnect_time = time.time()
+        now = time.time()
+        self._disconnect_time = now
         failure = self._reason_is_failure(reason_code)
 
         if not failure:
-            self._current_backoff = self._reconnect_min
             self._connected = False
             # Log clean disconnect with helpful metadata
-            client_id = None
-            try:
-                raw_id = getattr(client, "client_id", None) or getattr(
-                    client, "_client_id", None
-                )
-                if isinstance(raw_id, (bytes, bytearray)):
-                    try:
-                        client_id = raw_id.decode("utf-8", errors="ignore")
-                    except Exception:
-                        client_id = str(raw_id)
-                else:
-                    client_id = str(raw_id) if raw_id is not None else None
-            except Exception:
-                client_id = None
+            client_id = self._extract_client_id(client)
 
             self._logger.debug(
                 "MQTT client disconnected cleanly",
@@ -652,7 +841,7 @@ class MQTTBrokerClient:
                 self.publish_meta_mqtt()
             except Exception as e:
                 self._logger.debug(
-                    f"Failed to publish MQTT meta on clean disconnect: {e}"
+                    "Failed to publish MQTT meta on clean disconnect: %s", e
                 )
 
             return
@@ -661,7 +850,7 @@ class MQTTBrokerClient:
         self._error_count += 1
         reason_value = getattr(reason_code, "value", reason_code)
         self._last_error = f"Connection lost (reason: {reason_value})"
-        self._last_error_time = time.time()
+        self._last_error_time = now
 
         # Track in Error Tracker if available (T058)
         if self._error_tracker and HAS_ERROR_TRACKER:
@@ -673,26 +862,16 @@ class MQTTBrokerClient:
                 details={"reason_code": reason_value},
             )
 
-        client_id = None
-        try:
-            raw_id = getattr(client, "client_id", None) or getattr(
-                client, "_client_id", None
-            )
-            if isinstance(raw_id, (bytes, bytearray)):
-                try:
-                    client_id = raw_id.decode("utf-8", errors="ignore")
-                except Exception:
-                    client_id = str(raw_id)
-            else:
-                client_id = str(raw_id) if raw_id is not None else None
-        except Exception:
-            client_id = None
+        client_id = self._extract_client_id(client)
 
-        delay = self._current_backoff
+        # This callback runs on paho's network thread. Reconnection is left
+        # entirely to paho's loop, which backs off exponentially between
+        # ``reconnect_delay_set`` bounds configured in connect().
         self._logger.warning(
-            "MQTT connection lost; scheduling reconnect",
+            "MQTT connection lost; paho will reconnect",
             extra={
-                "delay_seconds": delay,
+                "reconnect_min_seconds": self._rc_min,
+                "reconnect_max_seconds": self._rc_max,
                 "reason_code": reason_value,
                 "client_id": client_id,
                 "disconnect_flags": disconnect_flags,
@@ -700,31 +879,87 @@ class MQTTBrokerClient:
             },
         )
 
-        time.sleep(delay)
+        self._connected = False
 
-        try:
-            client.reconnect()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            self._logger.warning("MQTT reconnect attempt failed", exc_info=exc)
-            self._last_error = f"Reconnect failed: {str(exc)}"
-            self._last_error_time = time.time()
-            self._error_count += 1
-
-            # Track in Error Tracker if available (T058)
-            if self._error_tracker and HAS_ERROR_TRACKER:
-                self._error_tracker.track_error(
-                    category=ErrorCategory.MQTT_CONNECTION,
-                    message=f"MQTT reconnect failed: {str(exc)}",
-                    severity=ErrorSeverity.ERROR,
-                    error_code="MQTT_RECONNECT_FAILED",
-                )
+    def _on_socket_open(self, client: Any, userdata: Any, sock: Any) -> None:
+        """Tune the freshly opened broker socket for small, latency-sensitive packets.
 
-        self._current_backoff = min(self._current_backoff * 2, self._reconnect_max)
-        self._connected = False
+        Disables Nagle's algorithm so small PUBLISH packets are sent
+        immediately, and enlarges the send buffer for publish bursts such as
+        full state snapshots. Websocket transports do not expose
+        ``setsockopt`` and are left untouched.
+        """
+        setsockopt = getattr(sock, "setsockopt", None)
+        if setsockopt is None:
+            return
+
+        for level, option, value in (
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_SNDBUF_BYTES),
+        ):
+            try:
+                setsockopt(level, option, value)
+            except OSError as exc:
+                self._logger.debug("Failed to set MQTT socket option: %s", exc)
+
+    def _handle_connect_fail(self, client: Any, userdata: Any) -> None:
+        """Track a failed automatic reconnect attempt made by paho's loop."""
+        self._logger.warning("MQTT reconnect attempt failed")
+        self._last_error = "Reconnect failed"
+        self._last_error_time = time.time()
+        self._error_count += 1
+
+        # Track in Error Tracker if available (T058)
+        if self._error_tracker and HAS_ERROR_TRACKER:
+            self._error_tracker.track_error(
+                category=ErrorCategory.MQTT_CONNECTION,
+                message="MQTT reconnect failed",
+                severity=ErrorSeverity.ERROR,
+                error_code="MQTT_RECONNECT_FAILED",
+            )
 
     # ------------------------------------------------------------------
     # Utility
     # ------------------------------------------------------------------
+    def _is_enabled_for(self, level: int) -> bool:
+        """Return whether ``level`` would be emitted by the configured logger.
+
+        Works for both stdlib loggers (``isEnabledFor``) and structlog's
+        filtering bound loggers (``is_enabled_for``).
+        """
+        check = getattr(self._logger, "isEnabledFor", None) or getattr(
+            self._logger, "is_enabled_for", None
+        )
+        return check(level) if check is not None else True
+
+    def _extract_client_id(self, client: Any) -> str | None:
+        """Return a printable client identifier for debugging.
+
+        paho exposes either ``client_id`` or ``_client_id``, often as bytes.
+        The id never changes for a client instance, so it is decoded once and
+        cached.
+        """
+        if self._cached_client_id is not None:
+            return self._cached_client_id
+
+        client_id = None
+        try:
+            raw_id = getattr(client, "client_id", None) or getattr(
+                client, "_client_id", None
+            )
+            if isinstance(raw_id, (bytes, bytearray)):
+                try:
+                    client_id = raw_id.decode("utf-8", errors="ignore")
+                except Exception:
+                    client_id = str(raw_id)
+            else:
+                client_id = str(raw_id) if raw_id is not None else None
+        except Exception:
+            client_id = None
+
+        self._cached_client_id = client_id
+        return client_id
+
     @staticmethod
     def _reason_is_failure(reason_code: Any) -> bool:
         if hasattr(reason_code, "is_failure"):
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from collections import deque
 from typing import Any, Callable
-import queue
 
+from src.core import fast_json
 from src.core.config_loader import AppConfig
 from src.core.smarttub_client import SmartTubClient
 
 
 logger = logging.getLogger("smarttub.mqtt.commands")
 
+_ON_OFF = frozenset(("on", "off"))
+
 
 class CommandManager:
     """Manages MQTT command subscriptions and execution."""
 
+    # Upper bound for the per-topic route cache
+    ROUTE_CACHE_SIZE = 1024
+
     def __init__(
         self, config: AppConfig, smarttub_client: SmartTubClient, mqtt_client: Any
     ):
@@ -23,9 +28,22 @@ class CommandManager:
         self.smarttub_client = smarttub_client
         self.mqtt_client = mqtt_client
         self._command_handlers: dict[str, Callable] = {}
-        self._command_queue: queue.Queue = queue.Queue()
+        # Strong references to running state-sync tasks so they are not
+        # garbage-collected before completion
+        self._command_tasks: set[asyncio.Task] = set()
+        # Commands handed over from the MQTT thread, drained on the event loop
+        self._pending_commands: deque[tuple[Callable, Any]] = deque()
+        self._drain_task: asyncio.Task | None = None
         self._event_loop: asyncio.AbstractEventLoop | None = None
         self._state_manager = None  # Will be set after initialization
+        # Debounce timer for the post-command state sync
+        self._pending_sync_handle: asyncio.TimerHandle | None = None
+
+        # base_topic is fixed for the process lifetime; precompute the prefix
+        # stripped from every inbound command topic.
+        self._base_prefix = f"{config.mqtt.base_topic}/"
+        self._base_prefix_len = len(self._base_prefix)
+        self._route_cache: dict[str, tuple | None] = {}
 
         self._setup_command_handlers()
 
@@ -43,21 +61,71 @@ class CommandManager:
         # of the spa id and allows subscribing with a wildcard (+/) to catch
         # commands for any spa.
 
+        # Each handler is specialized once here: the SmartTub client method,
+        # the payload keys to read, the value conversion/validation and the
+        # injected id are baked into a closure (see `_make_setter`).
+
         # Heater commands - using _writetopic convention
         self._command_handlers["heater/target_temperature_writetopic"] = (
-            self._handle_set_temperature
+            self._make_setter(
+                "temperature", "set_temperature", ("temperature", "value"), float
+            )
+        )
+        self._command_handlers["heater/mode_writetopic"] = self._make_setter(
+            "heat mode", "set_heat_mode", ("mode", "value"), _to_mode
         )
-        self._command_handlers["heater/mode_writetopic"] = self._handle_set_heat_mode
 
         # Pump commands - using _writetopic convention
-        self._command_handlers["pumps/state_writetopic"] = self._handle_set_pump_state
+        self._command_handlers["pumps/state_writetopic"] = self._make_setter(
+            "pump state", "set_pump_state", ("state",), _to_on_off, "pump_id"
+        )
 
         # Light commands - using _writetopic convention
-        self._command_handlers["lights/state_writetopic"] = self._handle_set_light_state
-        self._command_handlers["lights/mode_writetopic"] = self._handle_set_light_mode
-        self._command_handlers["lights/color_writetopic"] = self._handle_set_light_color
-        self._command_handlers["lights/brightness_writetopic"] = (
-            self._handle_set_light_brightness
+        self._command_handlers["lights/state_writetopic"] = self._make_setter(
+            "light state", "set_light_state", ("state",), _to_on_off, "light_id"
+        )
+        # A bare "off" payload is normalized to {"state": "off"}
+        self._command_handlers["lights/mode_writetopic"] = self._make_setter(
+            "light mode",
+            "set_light_mode",
+            ("mode", "value", "state"),
+            _to_mode,
+            "light_id",
+        )
+        self._command_handlers["lights/color_writetopic"] = self._make_setter(
+            "light color", "set_light_color", ("color", "value"), _to_color, "light_id"
+        )
+        self._command_handlers["lights/brightness_writetopic"] = self._make_setter(
+            "light brightness",
+            "set_light_brightness",
+            ("brightness", "value"),
+            _to_brightness,
+            "light_id",
+        )
+
+        # Dispatch table keyed on the tokenized topic remainder
+        # '<spa_id>/<component>[/<id>]/<value>_writetopic' as
+        # (segments after spa_id, component, last segment) ->
+        # (handler, name of the id field injected into the payload or None).
+        self._dispatch: dict[tuple[int, str, str], tuple[Callable, str | None]] = {}
+        for command_path, handler in self._command_handlers.items():
+            component, value_topic = command_path.split("/")
+            self._dispatch[(2, component, value_topic)] = (handler, None)
+            if component == "pumps":
+                self._dispatch[(3, component, value_topic)] = (handler, "pump_id")
+            elif component == "lights":
+                self._dispatch[(3, component, value_topic)] = (handler, "light_id")
+
+        # Subscription topics follow directly from the dispatch table, using
+        # single-level wildcards for the spa id and the pump/light id:
+        #   <base_topic>/+/<component>/<value>_writetopic
+        #   <base_topic>/+/<component>/+/<value>_writetopic
+        prefix = f"{self._base_prefix}+/"
+        self._command_topics: tuple[str, ...] = tuple(
+            f"{prefix}{component}/{value_topic}"
+            if depth == 2
+            else f"{prefix}{component}/+/{value_topic}"
+            for depth, component, value_topic in self._dispatch
         )
 
     def set_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
@@ -67,7 +135,7 @@ class CommandManager:
         handlers can be executed in the correct event loop.
         """
         self._event_loop = loop
-        logger.debug(f"Event loop set for CommandManager: {loop}")
+        logger.debug("Event loop set for CommandManager: %s", loop)
 
     def set_state_manager(self, state_manager) -> None:
         """Set the state manager for triggering immediate state updates after commands.
@@ -78,25 +146,6 @@ class CommandManager:
         self._state_manager = state_manager
         logger.debug("State manager set for CommandManager")
 
-    async def process_command_queue(self) -> None:
-        """Process commands from the queue in the main event loop.
-
-        This should be run as a background task in the main event loop.
-        """
-        while True:
-            try:
-                # Check queue without blocking
-                try:
-                    handler, data = self._command_queue.get_nowait()
-                    # Execute the async handler
-                    asyncio.create_task(handler(data))
-                except queue.Empty:
-                    # No commands, wait a bit before checking again
-                    await asyncio.sleep(0.1)
-            except Exception as e:
-                logger.error(f"Error processing command queue: {e}", exc_info=True)
-                await asyncio.sleep(1)
-
     def subscribe_commands(self) -> None:
         """Subscribe to all command topics.
 
@@ -104,44 +153,60 @@ class CommandManager:
         writable values. Per-component write topics are also supported (e.g.,
         per-pump state_writetopic).
         """
-        base_topic = self.config.mqtt.base_topic
-
-        # Subscribe to spa-scoped command topics using a single-level wildcard
-        # for the spa id: <base_topic>/+/component/<value>_writetopic
-        for command_path in self._command_handlers.keys():
-            topic = f"{base_topic}/+/{command_path}"
-            self.mqtt_client.subscribe(topic, self._handle_command_message)
-            logger.info(f"Subscribed to command topic: {topic}")
-
-        # Also subscribe to per-pump command topics under:
-        # <base_topic>/{spa_id}/pumps/{pump_id}/state_writetopic
-        # We use single-level wildcards for spa_id and pump_id so handlers can extract them.
-        pump_topic = f"{base_topic}/+/pumps/+/state_writetopic"
-        self.mqtt_client.subscribe(pump_topic, self._handle_command_message)
-        logger.info(f"Subscribed to per-pump command topic: {pump_topic}")
-
-        # Also subscribe to per-light command topics:
-        # <base_topic>/{spa_id}/lights/{light_id}/state_writetopic
-        # <base_topic>/{spa_id}/lights/{light_id}/mode_writetopic
-        # <base_topic>/{spa_id}/lights/{light_id}/color_writetopic
-        # <base_topic>/{spa_id}/lights/{light_id}/brightness_writetopic
-        light_state_topic = f"{base_topic}/+/lights/+/state_writetopic"
-        self.mqtt_client.subscribe(light_state_topic, self._handle_command_message)
-        logger.info(f"Subscribed to per-light state command topic: {light_state_topic}")
-
-        light_mode_topic = f"{base_topic}/+/lights/+/mode_writetopic"
-        self.mqtt_client.subscribe(light_mode_topic, self._handle_command_message)
-        logger.info(f"Subscribed to per-light mode command topic: {light_mode_topic}")
-
-        light_color_topic = f"{base_topic}/+/lights/+/color_writetopic"
-        self.mqtt_client.subscribe(light_color_topic, self._handle_command_message)
-        logger.info(f"Subscribed to per-light color command topic: {light_color_topic}")
-
-        light_brightness_topic = f"{base_topic}/+/lights/+/brightness_writetopic"
-        self.mqtt_client.subscribe(light_brightness_topic, self._handle_command_message)
+        # One SUBSCRIBE packet for all command topics instead of one per topic
+        self.mqtt_client.subscribe_many(
+            self._command_topics, self._handle_command_message
+        )
         logger.info(
-            f"Subscribed to per-light brightness command topic: {light_brightness_topic}"
+            "Subscribed to %d command topics under %s+/",
+            len(self._command_topics),
+            self._base_prefix,
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Command topics: %s", ", ".join(self._command_topics))
+
+    def _resolve_topic(self, topic: str) -> tuple | None:
+        """Resolve a command topic to its route, caching the result per topic.
+
+        Returns ``(spa_id, handler, command_path, id_kwargs, id_label)`` or
+        ``None`` when no handler matches. ``id_kwargs`` holds the pump/light
+        id to inject into the payload (empty for spa-level topics) and
+        ``id_label`` is its pre-rendered log suffix. Command topics repeat constantly and
+        base_topic never changes at runtime, so the cache is never invalidated;
+        it is only bounded so stray topics cannot grow it without limit.
+        """
+        try:
+            return self._route_cache[topic]
+        except KeyError:
+            pass
+
+        # Extract the command path relative to base_topic. Expected topic
+        # shape: <base_topic>/<spa_id>/<command_path>
+        if topic.startswith(self._base_prefix):
+            remainder = topic[self._base_prefix_len :]
+        else:
+            remainder = topic
+
+        # remainder should be like '<spa_id>/heater/target_temperature_writetopic'
+        # or '<spa_id>/pumps/<pump_id>/state_writetopic'. Tokenize once and
+        # resolve the handler with a single dispatch-table lookup.
+        parts = remainder.split("/")
+        route = None
+        if len(parts) >= 3:
+            entry = self._dispatch.get((len(parts) - 1, parts[1], parts[-1]))
+            if entry is not None:
+                handler, id_field = entry
+                command_path = f"{parts[1]}/{parts[-1]}"
+                if id_field is None:
+                    id_kwargs, id_label = {}, ""
+                else:
+                    id_kwargs = {id_field: parts[2]}
+                    id_label = f", {id_field}={parts[2]}"
+                route = (parts[0], handler, command_path, id_kwargs, id_label)
+
+        if len(self._route_cache) < self.ROUTE_CACHE_SIZE:
+            self._route_cache[topic] = route
+        return route
 
     def _handle_command_message(self, topic: str, payload: str) -> None:
         """Handle incoming command messages.
@@ -149,97 +214,49 @@ class CommandManager:
         Supports both the new _writetopic convention and per-component topics
         like pumps/{id}/state_writetopic or lights/{id}/brightness_writetopic.
         """
-        logger.info(f"MQTT command received: topic='{topic}', payload='{payload}'")
+        logger.debug("MQTT command received: topic='%s', payload='%s'", topic, payload)
         try:
             if not self.smarttub_client.spas:
                 logger.warning(
-                    f"Spa not initialized yet, ignoring command: {topic}, spas: {self.smarttub_client.spas}"
+                    "Spa not initialized yet, ignoring command: %s, spas: %s",
+                    topic,
+                    self.smarttub_client.spas,
                 )
                 return
         except AttributeError:
-            logger.warning(f"Spa not available yet, ignoring command: {topic}")
+            logger.warning("Spa not available yet, ignoring command: %s", topic)
             return
         try:
-            # Extract the command path relative to base_topic. Expected topic
-            # shape: <base_topic>/<spa_id>/<command_path>
-            base_topic = self.config.mqtt.base_topic
-            if topic.startswith(f"{base_topic}/"):
-                remainder = topic[len(f"{base_topic}/") :]
-            else:
-                remainder = topic
-
-            # remainder should be like '<spa_id>/heater/target_temperature_writetopic'
-            parts = remainder.split("/", 1)
-            if len(parts) == 2:
-                spa_id, command_path = parts[0], parts[1]
-            else:
-                spa_id = None
-                command_path = remainder
-
-            # Support per-pump topics like: 'pumps/<pump_id>/state_writetopic'.
-            # Map to the logical handler key 'pumps/state_writetopic' and inject
-            # 'pump_id' into the parsed data.
-            handler = self._command_handlers.get(command_path)
-
-            # Detect pumps/<pid>/state_writetopic pattern
-            if handler is None and command_path.startswith("pumps/"):
-                parts_cmd = command_path.split("/", 2)
-                # parts_cmd -> ['pumps', '<pid>', 'state_writetopic'] expected
-                if len(parts_cmd) == 3 and parts_cmd[2] == "state_writetopic":
-                    pump_id = parts_cmd[1]
-                    # canonical handler key for pump state
-                    handler = self._command_handlers.get("pumps/state_writetopic")
-                    # Parse payload and inject pump_id
-                    raw_data = self._parse_payload(payload)
-                    data = self._normalize_command_data(raw_data, pump_id=pump_id)
-
-                    logger.info(
-                        f"Executing mapped pump command: pumps/state_writetopic (spa_id={spa_id}) pump_id={pump_id} with payload: {data}"
-                    )
-                    if handler:
-                        self._execute_handler(handler, data)
-                        return
-
-            # Detect lights/<light_id>/<value>_writetopic pattern
-            if handler is None and command_path.startswith("lights/"):
-                parts_cmd = command_path.split("/", 2)
-                # parts_cmd -> ['lights', '<light_id>', 'state_writetopic'] expected
-                if len(parts_cmd) == 3 and parts_cmd[2].endswith("_writetopic"):
-                    light_id = parts_cmd[1]
-                    value_type = parts_cmd[
-                        2
-                    ]  # e.g., state_writetopic, color_writetopic, brightness_writetopic
-                    # canonical handler key for light commands
-                    handler = self._command_handlers.get(f"lights/{value_type}")
-                    # Parse payload and inject light_id
-                    raw_data = self._parse_payload(payload)
-                    data = self._normalize_command_data(raw_data, light_id=light_id)
+            route = self._resolve_topic(topic)
+            if route is None:
+                logger.warning("No handler found for command topic: %s", topic)
+                return
 
-                    logger.info(
-                        f"Executing mapped light command: lights/{value_type} (spa_id={spa_id}) light_id={light_id} with payload: {data}"
-                    )
-                    if handler:
-                        self._execute_handler(handler, data)
-                        return
+            spa_id, handler, command_path, id_kwargs, id_label = route
 
-            if handler:
-                # Parse JSON payload if possible, otherwise use raw payload
-                data = self._parse_payload(payload)
+            # Handlers always receive a normalized dict; per-component topics
+            # also inject the pump_id/light_id taken from the topic. One INFO
+            # line per command; arguments are formatted lazily.
+            data = self._normalize_command_data(
+                self._parse_payload(payload), **id_kwargs
+            )
+            logger.info(
+                "Executing command: %s (spa_id=%s%s) with payload: %s",
+                command_path,
+                spa_id,
+                id_label,
+                data,
+            )
 
-                logger.info(
-                    f"Executing command: {command_path} (spa_id={spa_id}) with payload: {data}"
-                )
-                self._execute_handler(handler, data)
-            else:
-                logger.warning(f"No handler found for command topic: {topic}")
+            self._execute_handler(handler, data)
         except Exception as e:
-            logger.error(f"Error handling command {topic}: {e}", exc_info=True)
+            logger.error("Error handling command %s: %s", topic, e, exc_info=True)
 
     def _parse_payload(self, payload: str) -> Any:
         """Parse payload as JSON if possible, otherwise return raw string."""
         try:
-            return json.loads(payload)
-        except json.JSONDecodeError:
+            return fast_json.loads(payload)
+        except fast_json.JSONDecodeError:
             return payload
         except Exception:
             return payload
@@ -255,46 +272,47 @@ class CommandManager:
             light_id: Optional light ID to inject
 
         Returns:
-            Normalized dict with injected IDs
+            Normalized dict with injected IDs. Scalar payloads become
+            ``{"state": "on"|"off"}`` or ``{"value": ...}``.
         """
         if isinstance(raw_data, dict):
-            data = raw_data.copy()
-            if pump_id:
-                data["pump_id"] = pump_id
-            if light_id:
-                data["light_id"] = light_id
-            return data
+            # Freshly decoded by _parse_payload and not retained elsewhere,
+            # so ids can be injected in place without copying
+            data = raw_data
+        elif isinstance(raw_data, (int, float)) and not isinstance(raw_data, bool):
+            # JSON numbers (e.g. 38, 37.5) keep their numeric value
+            data = {"value": raw_data}
         else:
             # treat scalar payload as the desired state/value string
             value_str = str(raw_data).strip()
-            data = {}
-
-            # Auto-detect the value type based on content
-            if value_str.lower() in ("on", "off"):
-                data["state"] = value_str.lower()
-            elif value_str.isdigit():
-                # Could be temperature, brightness, etc.
-                data["value"] = int(value_str)
+            lowered = value_str.lower()
+            if lowered in _ON_OFF:
+                data = {"state": lowered}
             else:
-                # Fallback: preserve raw value
-                data["value"] = value_str
-
-            if pump_id:
-                data["pump_id"] = pump_id
-            if light_id:
-                data["light_id"] = light_id
+                # Could be temperature, brightness, etc.; fall back to the
+                # raw string when it is not an integer
+                try:
+                    data = {"value": int(value_str)}
+                except ValueError:
+                    data = {"value": value_str}
 
-            return data
+        if pump_id:
+            data["pump_id"] = pump_id
+        if light_id:
+            data["light_id"] = light_id
+        return data
 
-    async def _trigger_state_update(self) -> None:
-        """Trigger an immediate state update after a successful command.
+    def _trigger_state_update(self) -> None:
+        """Schedule an immediate state update after a successful command.
 
         This ensures MQTT state topics reflect the new hardware state
         without waiting for the next polling cycle.
 
         Adds a configurable delay to allow the SmartTub Cloud API to process
         the command before fetching the updated state. The delay compensates
-        for cloud API propagation latency.
+        for cloud API propagation latency. The update is debounced: a burst
+        of commands (e.g. a brightness slider) restarts a single timer and
+        results in one state sync once the burst settles.
 
         The delay can be configured via:
         - YAML: smarttub.state_update_delay_seconds (default: 2.5)
@@ -306,190 +324,157 @@ class CommandManager:
             )
             return
 
+        delay = self.config.smarttub.state_update_delay_seconds
+        if self._pending_sync_handle is not None:
+            self._pending_sync_handle.cancel()
+        # Called from handlers running on the event loop thread
+        self._pending_sync_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_state_sync
+        )
+        logger.debug("Immediate state update scheduled in %ss", delay)
+
+    def _start_state_sync(self) -> None:
+        """Timer callback: run the debounced state sync as a task."""
+        self._pending_sync_handle = None
+        task = asyncio.create_task(self._run_state_sync())
+        self._command_tasks.add(task)
+        task.add_done_callback(self._command_tasks.discard)
+
+    async def _run_state_sync(self) -> None:
+        """Refresh state from the SmartTub API after a command burst."""
         try:
-            delay = self.config.smarttub.state_update_delay_seconds
-            logger.debug(f"Triggering immediate state update after {delay}s delay")
-            # Wait for SmartTub Cloud API to process the command
-            # The cloud API is slow and needs time to update its state
-            await asyncio.sleep(delay)
             await self._state_manager.sync_state()
             logger.debug("Immediate state update completed")
         except Exception as e:
             logger.error(
-                f"Failed to trigger immediate state update: {e}", exc_info=True
+                "Failed to trigger immediate state update: %s", e, exc_info=True
             )
 
     def _execute_handler(self, handler: Callable, data: Any) -> None:
         """Queue async handler for execution in the main event loop.
 
         This is called from the MQTT callback thread, so we can't directly
-        use asyncio.create_task(). Instead, we queue the handler and data
-        for processing by the main event loop.
+        use asyncio.create_task(). Commands are appended to a deque (atomic
+        under the GIL) and the event loop is woken once per burst to drain
+        it, instead of once per command. This relies on paho delivering
+        messages from a single network thread.
 
         Args:
             handler: Async handler function to execute
             data: Data to pass to handler
         """
-        # Put handler and data in queue for processing by main event loop
-        self._command_queue.put((handler, data))
-        logger.debug(f"Queued command handler: {handler.__name__}")
-
-    async def _handle_set_temperature(self, data: Any) -> None:
-        """Handle set temperature command."""
-        try:
-            if isinstance(data, dict):
-                temperature = data.get("temperature")
-            else:
-                temperature = float(data)
-
-            if temperature is not None:
-                await self.smarttub_client.set_temperature(temperature)
-                logger.info(f"Set temperature to {temperature}°C")
-
-                # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error("No temperature value provided in set_temperature command")
-        except Exception as e:
-            logger.error(f"Failed to set temperature: {e}")
-
-    async def _handle_set_heat_mode(self, data: Any) -> None:
-        """Handle set heat mode command."""
-        try:
-            if isinstance(data, dict):
-                mode = data.get("mode")
-            else:
-                mode = str(data).upper()
-
-            if mode:
-                await self.smarttub_client.set_heat_mode(mode)
-                logger.info(f"Set heat mode to {mode}")
-
-                # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error("No mode value provided in set_heat_mode command")
-        except Exception as e:
-            logger.error(f"Failed to set heat mode: {e}")
-
-    async def _handle_set_pump_state(self, data: Any) -> None:
-        """Handle set pump state command."""
-        try:
-            if isinstance(data, dict):
-                state = data.get("state")
-            else:
-                state = str(data).lower()
-
-            if state in ["on", "off"]:
-                # Extract optional pump_id injected by topic parsing
-                pump_id = None
-                if isinstance(data, dict):
-                    pump_id = data.get("pump_id")
-
-                await self.smarttub_client.set_pump_state(
-                    state == "on", pump_id=pump_id
-                )
-                logger.info(f"Pump control requested: {state} (pump_id={pump_id})")
+        if self._event_loop is None:
+            logger.error(
+                "No event loop set, dropping command handler: %s", handler.__name__
+            )
+            return
 
-                # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error(f"Invalid pump state: {state}. Must be 'on' or 'off'")
-        except Exception as e:
-            logger.error(f"Failed to set pump state: {e}")
+        pending = self._pending_commands
+        pending.append((handler, data))
+        # Only the first command of a burst needs to wake the loop; the drain
+        # keeps popping until the deque is empty.
+        if len(pending) == 1:
+            self._event_loop.call_soon_threadsafe(self._ensure_command_drain)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Queued command handler: %s", handler.__name__)
+
+    def _ensure_command_drain(self) -> None:
+        """Start the drain task unless one is running; runs on the event loop."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain_pending_commands())
+
+    async def _drain_pending_commands(self) -> None:
+        """Run queued handlers one after another in arrival order.
+
+        Commands are low-rate and the SmartTub API is rate-limited anyway, so
+        handlers are awaited directly instead of spawning a task per command.
+        """
+        pending = self._pending_commands
+        while pending:
+            handler, data = pending.popleft()
+            try:
+                await handler(data)
+            except Exception as e:
+                logger.error("Error executing command handler: %s", e, exc_info=True)
+
+    def _make_setter(
+        self,
+        name: str,
+        method_name: str,
+        keys: tuple[str, ...],
+        convert: Callable[[Any], Any],
+        id_field: str | None = None,
+    ) -> Callable:
+        """Build an async command handler for one SmartTub client setter.
 
-    async def _handle_set_light_state(self, data: Any) -> None:
-        """Handle set light state command."""
-        try:
-            if isinstance(data, dict):
-                state = data.get("state")
-                light_id = data.get("light_id")
-            else:
-                state = str(data).lower()
-                light_id = None
+        Args:
+            name: Human readable command name used in log messages
+            method_name: SmartTubClient coroutine method to call
+            keys: Payload keys to read, in order; the first present one wins
+            convert: Converts/validates the raw value; raises ValueError (or
+                TypeError) when the value is not acceptable
+            id_field: Payload key holding the pump/light id, passed through
+                as a keyword argument of the same name
 
-            if state in ["on", "off"]:
-                await self.smarttub_client.set_light_state(
-                    state == "on", light_id=light_id
-                )
-                logger.info(f"Light control requested: {state} (light_id={light_id})")
+        Returns:
+            Async handler taking the normalized command dict
+        """
+        # Resolve the client method once instead of on every command
+        method = getattr(self.smarttub_client, method_name)
+
+        async def handler(data: dict) -> None:
+            raw = None
+            for key in keys:
+                if (raw := data.get(key)) is not None:
+                    break
+            try:
+                value = convert(raw)
+            except (TypeError, ValueError):
+                logger.error("Invalid %s value: %s", name, raw)
+                return
+            try:
+                if id_field is None:
+                    await method(value)
+                    logger.info("Set %s to %s", name, raw)
+                else:
+                    component_id = data.get(id_field)
+                    await method(value, **{id_field: component_id})
+                    logger.info(
+                        "Set %s to %s (%s=%s)", name, raw, id_field, component_id
+                    )
 
                 # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error(f"Invalid light state: {state}. Must be 'on' or 'off'")
-        except Exception as e:
-            logger.error(f"Failed to set light state: {e}")
+                self._trigger_state_update()
+            except Exception as e:
+                logger.error("Failed to set %s: %s", name, e)
 
-    async def _handle_set_light_mode(self, data: Any) -> None:
-        """Handle set light mode command (e.g., OFF, WHITE, PURPLE, LowSpeedWheel, ColorWheel)."""
-        try:
-            if isinstance(data, dict):
-                mode = data.get("mode") or data.get("value")
-                light_id = data.get("light_id")
-            else:
-                mode = str(data).upper()
-                light_id = None
+        handler.__name__ = f"set_{name.replace(' ', '_')}"
+        return handler
 
-            if mode:
-                await self.smarttub_client.set_light_mode(mode, light_id=light_id)
-                logger.info(
-                    f"Light mode control requested: {mode} (light_id={light_id})"
-                )
 
-                # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error("No mode value provided in set_light_mode command")
-        except Exception as e:
-            logger.error(f"Failed to set light mode: {e}")
+def _to_mode(value: Any) -> str:
+    """Heat/light modes are passed upper-cased; empty values are rejected."""
+    if not value:
+        raise ValueError(value)
+    return str(value).upper()
 
-    async def _handle_set_light_color(self, data: Any) -> None:
-        """Handle set light color command."""
-        try:
-            if isinstance(data, dict):
-                color = data.get("color") or data.get("value")
-                light_id = data.get("light_id")
-            else:
-                color = str(data)
-                light_id = None
 
-            if color:
-                await self.smarttub_client.set_light_color(color, light_id=light_id)
-                logger.info(
-                    f"Light color control requested: {color} (light_id={light_id})"
-                )
+def _to_on_off(value: Any) -> bool:
+    """Map a normalized "on"/"off" state to the enabled flag."""
+    if value not in _ON_OFF:
+        raise ValueError(value)
+    return value == "on"
 
-                # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error("No color value provided in set_light_color command")
-        except Exception as e:
-            logger.error(f"Failed to set light color: {e}")
 
-    async def _handle_set_light_brightness(self, data: Any) -> None:
-        """Handle set light brightness command."""
-        try:
-            if isinstance(data, dict):
-                brightness = data.get("brightness") or data.get("value")
-                light_id = data.get("light_id")
-            else:
-                brightness = int(data)
-                light_id = None
+def _to_color(value: Any) -> Any:
+    """Colors are passed through as-is; empty values are rejected."""
+    if not value:
+        raise ValueError(value)
+    return value
 
-            if brightness is not None and 0 <= brightness <= 100:
-                await self.smarttub_client.set_light_brightness(
-                    brightness, light_id=light_id
-                )
-                logger.info(
-                    f"Light brightness control requested: {brightness}% (light_id={light_id})"
-                )
 
-                # Trigger immediate state update
-                await self._trigger_state_update()
-            else:
-                logger.error(
-                    f"Invalid brightness value: {brightness}. Must be between 0 and 100"
-                )
-        except Exception as e:
-            logger.error(f"Failed to set light brightness: {e}")
+def _to_brightness(value: Any) -> Any:
+    """Brightness must be a percentage between 0 and 100."""
+    if not 0 <= value <= 100:
+        raise ValueError(value)
+    return value
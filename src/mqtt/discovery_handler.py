@@ -5,16 +5,18 @@ Handles MQTT messages for discovery control and publishes status updates.
 """
 
 import asyncio
-import json
 import logging
 from typing import Optional
 
+from src.core import fast_json
 from src.core.discovery_coordinator import DiscoveryCoordinator
 from src.core.discovery_state import DiscoveryState
 from src.mqtt.topic_mapper import MQTTTopicMapper
 
 logger = logging.getLogger(__name__)
 
+_VALID_ACTIONS = frozenset(("start", "stop"))
+
 
 class DiscoveryMQTTHandler:
     """
@@ -76,11 +78,11 @@ class DiscoveryMQTTHandler:
         # Subscribe to control topic
         control_topic = self.topic_mapper.get_discovery_control_topic()
         self.mqtt_client.subscribe(
-            topic=control_topic, callback=self._on_control_message
+            topic=control_topic, callback=self._on_control_message, binary=True
         )
         self._subscribed = True
 
-        logger.info(f"Discovery MQTT handler started, subscribed to {control_topic}")
+        logger.info("Discovery MQTT handler started, subscribed to %s", control_topic)
 
         # Publish initial status
         await self.coordinator.publish_status_to_mqtt()
@@ -110,16 +112,13 @@ class DiscoveryMQTTHandler:
         try:
             messages = self.topic_mapper.publish_discovery_status(state)
 
-            # Publish all messages
-            for msg in messages:
-                self.mqtt_client.publish(
-                    topic=msg.topic, payload=msg.payload, qos=msg.qos, retain=msg.retain
-                )
+            # Publish all messages in one batch
+            self.mqtt_client.publish_many(messages)
 
-            logger.debug(f"Published {len(messages)} discovery status messages")
+            logger.debug("Published %s discovery status messages", len(messages))
 
         except Exception as e:
-            logger.error(f"Failed to publish discovery status: {e}", exc_info=True)
+            logger.error("Failed to publish discovery status: %s", e, exc_info=True)
 
     def _on_control_message(self, topic: str, payload: bytes):
         """
@@ -136,29 +135,23 @@ class DiscoveryMQTTHandler:
             payload: Message payload (can be bytes or str)
         """
         try:
-            # Parse JSON payload
+            # Parse JSON payload; bytes are decoded directly by the parser
             try:
-                # Handle both bytes and str
-                if isinstance(payload, bytes):
-                    payload_str = payload.decode("utf-8")
-                else:
-                    payload_str = payload
-
-                data = json.loads(payload_str)
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                logger.warning(f"Invalid JSON in discovery control message: {e}")
+                data = fast_json.loads(payload)
+            except (fast_json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning("Invalid JSON in discovery control message: %s", e)
                 return
 
             # Validate action
             action = data.get("action")
-            if action not in ["start", "stop"]:
-                logger.warning(f"Invalid discovery action: {action}")
+            if action not in _VALID_ACTIONS:
+                logger.warning("Invalid discovery action: %s", action)
                 return
 
             # Handle action
             if action == "start":
                 mode = data.get("mode", "quick")
-                logger.info(f"MQTT control: Starting discovery (mode={mode})")
+                logger.info("MQTT control: Starting discovery (mode=%s)", mode)
 
                 # Schedule async start using event loop from MQTT thread
                 if self._event_loop is None:
@@ -183,7 +176,7 @@ class DiscoveryMQTTHandler:
 
         except Exception as e:
             logger.error(
-                f"Error handling discovery control message: {e}", exc_info=True
+                "Error handling discovery control message: %s", e, exc_info=True
             )
 
     async def _handle_start_command(self, mode: str):
@@ -197,14 +190,14 @@ class DiscoveryMQTTHandler:
             result = await self.coordinator.start_discovery(mode=mode)
 
             if result["success"]:
-                logger.info(f"Discovery started via MQTT: mode={mode}")
+                logger.info("Discovery started via MQTT: mode=%s", mode)
             else:
                 logger.warning(
-                    f"Failed to start discovery via MQTT: {result.get('error')}"
+                    "Failed to start discovery via MQTT: %s", result.get("error")
                 )
 
         except Exception as e:
-            logger.error(f"Error starting discovery via MQTT: {e}", exc_info=True)
+            logger.error("Error starting discovery via MQTT: %s", e, exc_info=True)
 
     async def _handle_stop_command(self):
         """
@@ -217,8 +210,8 @@ class DiscoveryMQTTHandler:
                 logger.info("Discovery stopped via MQTT")
             else:
                 logger.warning(
-                    f"Failed to stop discovery via MQTT: {result.get('error')}"
+                    "Failed to stop discovery via MQTT: %s", result.get("error")
                 )
 
         except Exception as e:
-            logger.error(f"Error stopping discovery via MQTT: {e}", exc_info=True)
+            logger.error("Error stopping discovery via MQTT: %s", e, exc_info=True)
@@ -4,39 +4,225 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Any
 
 import structlog
 
+from src.core import fast_json
 from src.core.config_loader import AppConfig
 from src.core.log_rotation import setup_file_logging
 
+_logger = logging.getLogger("smarttub.mqtt.log_bridge")
+
+
+def _iso_now() -> str:
+    """UTC ISO-8601 timestamp in the same format as TimeStamper(fmt="iso", utc=True)."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _add_timestamp(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Processor stamping events with _iso_now(), replacing TimeStamper."""
+    event_dict["timestamp"] = _iso_now()
+    return event_dict
+
+
+# Level names as emitted by structlog's add_log_level (plus the config-only
+# "trace", which maps to DEBUG)
+_LEVEL_NUMBERS = {
+    "trace": logging.DEBUG,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+class _BackgroundPublisher:
+    """Publish MQTT messages from a daemon thread in back-to-back batches.
+
+    Callers (any thread) only enqueue; a single consumer thread serializes and
+    publishes, so the logging call site never contends on the MQTT client. paho hands QoS 1
+    messages to its network loop without waiting for the PUBACK, so a batch
+    is simply issued back-to-back. The thread is started on first use.
+    """
+
+    __slots__ = (
+        "_mqtt_client",
+        "_name",
+        "_queue",
+        "_thread",
+        "_start_lock",
+        "_fail_count",
+        "_last_fail_log",
+    )
+
+    MAX_BATCH = 64
+    FAILURE_LOG_INTERVAL = 5.0
+
+    def __init__(self, mqtt_client: Any, name: str) -> None:
+        self._mqtt_client = mqtt_client
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._fail_count = 0
+        self._last_fail_log = float("-inf")
+
+    def submit(self, topic: str, event: dict[str, Any], qos: int) -> None:
+        if self._thread is None:
+            self._start()
+        self._queue.put((topic, event, qos))
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        # Serialize + publish is the per-event hot path; bind both once.
+        dumps = fast_json.dumps
+        publish = self._mqtt_client.publish
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < self.MAX_BATCH:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            for topic, event, qos in batch:
+                try:
+                    publish(topic, dumps(event), qos=qos, retain=False)
+                # pragma: no cover - forwarding should not break operations
+                except Exception as e:
+                    self._report_failure(topic, e)
+
+    def _report_failure(self, topic: str, error: Exception) -> None:
+        """Log publish failures at most once per FAILURE_LOG_INTERVAL seconds.
+
+        Uses the stdlib logger: a structlog call here would be forwarded back
+        into this queue and loop while the broker is down.
+        """
+        self._fail_count += 1
+        now = time.monotonic()
+        if now - self._last_fail_log < self.FAILURE_LOG_INTERVAL:
+            return
+        self._last_fail_log = now
+        _logger.warning(
+            "Failed to forward %s event to MQTT topic %s (failures=%d): %s",
+            self._name,
+            topic,
+            self._fail_count,
+            error,
+        )
+
 
 class _MQTTForwarder:
-    def __init__(self, enabled: bool, mqtt_client: Any, topic: str) -> None:
+    __slots__ = (
+        "_enabled",
+        "_mqtt_client",
+        "_topic",
+        "_allowed_levels",
+        "_fields",
+        "_max_value_len",
+        "_publisher",
+    )
+
+    def __init__(
+        self,
+        enabled: bool,
+        mqtt_client: Any,
+        topic: str,
+        *,
+        min_level: int = logging.NOTSET,
+        fields: tuple[str, ...] | None = None,
+        max_value_len: int = 256,
+    ) -> None:
         self._enabled = enabled
         self._mqtt_client = mqtt_client
         self._topic = topic
+        # Level names (as set by add_log_level) at or above min_level,
+        # precomputed so the per-event check is a single set lookup
+        self._allowed_levels = frozenset(
+            name for name, number in _LEVEL_NUMBERS.items() if number >= min_level
+        )
+        self._fields = frozenset(fields) if fields else None
+        self._max_value_len = max_value_len
+        self._publisher = _BackgroundPublisher(mqtt_client, "log_forward")
 
     def __call__(self, _: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
         if self._enabled and self._mqtt_client is not None:
-            try:
-                payload = json.dumps(event_dict, default=str)
-                self._mqtt_client.publish(self._topic, payload, 0, False)
-            except Exception:  # pragma: no cover - forwarding should not break logging
-                pass
+            if event_dict.get("level") not in self._allowed_levels:
+                return event_dict
+            # Events logged by the publisher thread itself (e.g. the broker
+            # client's DEBUG "mqtt-publish" line) would be queued again and
+            # republished forever; keep them local.
+            if threading.current_thread() is self._publisher._thread:
+                return event_dict
+            # QoS 0 log lines would be dropped by paho while disconnected;
+            # skip the copy and enqueue up front instead
+            if not self._mqtt_client.is_connected:
+                return event_dict
+            # Only enqueue here; serialization and publish run on the
+            # publisher thread
+            self._publisher.submit(self._topic, self._slim(event_dict), 0)
         return event_dict
 
+    def _slim(self, event_dict: dict[str, Any]) -> dict[str, Any]:
+        """Copy the event, keeping only allowed fields and truncating long strings.
+
+        Always returns a new dict: the original keeps flowing through the
+        processor chain while the copy is serialized on another thread.
+        """
+        fields = self._fields
+        max_len = self._max_value_len
+        if fields is None and not max_len:
+            return dict(event_dict)
+        slim = {}
+        for key, value in event_dict.items():
+            if fields is not None and key not in fields:
+                continue
+            if max_len and isinstance(value, str) and len(value) > max_len:
+                value = value[:max_len]
+            slim[key] = value
+        return slim
+
+
+# Audit events that must reach the broker are sent at QoS 1; informational
+# attempt/success events use QoS 0 (at most once).
+_AUDIT_QOS_BY_EVENT = {"command_failure": 1, "command_timeout": 1}
+
 
 class CommandAuditLogger:
     """Logger for command audit events with MQTT forwarding."""
 
+    __slots__ = (
+        "config",
+        "mqtt_client",
+        "audit_topic",
+        "_enabled",
+        "_publisher",
+        "_slog",
+    )
+
     def __init__(self, config: AppConfig, mqtt_client: Any):
         self.config = config
         self.mqtt_client = mqtt_client
         base_topic = (config.mqtt.base_topic or "smarttub-mqtt").rstrip("/")
         self.audit_topic = f"{base_topic}/meta/commands"
         self._enabled = config.logging.mqtt_forwarding
+        self._publisher = _BackgroundPublisher(mqtt_client, "command_audit")
+        self._slog = structlog.get_logger("command_audit")
 
     def log_command_attempt(
         self,
@@ -59,9 +245,7 @@ class CommandAuditLogger:
             "command_type": command_type,
             "command_params": command_params,
             "user_id": user_id,
-            "timestamp": structlog.processors.TimeStamper(fmt="iso", utc=True)(
-                None, None, {}
-            )["timestamp"],
+            "timestamp": _iso_now(),
         }
         self._log_audit_event(event)
 
@@ -80,9 +264,7 @@ class CommandAuditLogger:
             "command_id": command_id,
             "command_type": command_type,
             "result": result or {},
-            "timestamp": structlog.processors.TimeStamper(fmt="iso", utc=True)(
-                None, None, {}
-            )["timestamp"],
+            "timestamp": _iso_now(),
         }
         self._log_audit_event(event)
 
@@ -107,9 +289,7 @@ class CommandAuditLogger:
             "command_type": command_type,
             "error": error,
             "error_details": error_details or {},
-            "timestamp": structlog.processors.TimeStamper(fmt="iso", utc=True)(
-                None, None, {}
-            )["timestamp"],
+            "timestamp": _iso_now(),
         }
         self._log_audit_event(event)
 
@@ -128,9 +308,7 @@ class CommandAuditLogger:
             "command_id": command_id,
             "command_type": command_type,
             "timeout_seconds": timeout_seconds,
-            "timestamp": structlog.processors.TimeStamper(fmt="iso", utc=True)(
-                None, None, {}
-            )["timestamp"],
+            "timestamp": _iso_now(),
         }
         self._log_audit_event(event)
 
@@ -140,129 +318,235 @@ class CommandAuditLogger:
         Args:
             event: Audit event data
         """
-        # Log to structured logging
-        logger = structlog.get_logger("command_audit")
-        logger.info("Command audit event", **event)
+        # Log to structured logging. The event is nested under "audit": its
+        # own "event" key would clash with the log message argument.
+        self._slog.info("Command audit event", audit=event)
 
-        # Forward to MQTT if enabled
+        # Forward to MQTT if enabled; serialized and published off-thread
         if self._enabled and self.mqtt_client is not None:
-            try:
-                payload = json.dumps(event, default=str)
-                self.mqtt_client.publish(self.audit_topic, payload, qos=1, retain=False)
-            except (
-                Exception
-            ) as e:  # pragma: no cover - forwarding should not break operations
-                logger.warning("Failed to forward command audit to MQTT", error=str(e))
+            qos = _AUDIT_QOS_BY_EVENT.get(event["event"], 0)
+            self._publisher.submit(self.audit_topic, event, qos)
+
+
+# Logger name -> setup_file_logging() handler key. Each logger writes ONLY to
+# its own file (plus the console):
+# - MQTT logs go to mqtt.log
+# - WebUI logs and uvicorn (uvicorn, uvicorn.access, uvicorn.error) go to webui.log
+# - SmartTub API and core logs go to smarttub.log
+_LOGGER_ROUTES = (
+    ("smarttub.mqtt", "mqtt"),
+    ("smarttub.webui", "webui"),
+    ("smarttub.api", "smarttub"),
+    ("smarttub.core", "smarttub"),
+    ("uvicorn", "webui"),
+    ("uvicorn.access", "webui"),
+    ("uvicorn.error", "webui"),
+)
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that coalesces records into one write() per batch.
+
+    Formatted lines are buffered and written out by a daemon thread
+    FLUSH_INTERVAL seconds after the first pending record, or immediately
+    once MAX_BUFFER characters are pending. The thread sleeps while nothing
+    is buffered and is stopped by close(); logging.shutdown() flushes any
+    remainder at exit.
+    """
+
+    FLUSH_INTERVAL = 0.01
+    MAX_BUFFER = 8192
+
+    def __init__(self, stream: Any = None) -> None:
+        super().__init__(stream)
+        self._buffer: list[str] = []
+        self._buffered = 0
+        # Last buffered record, reported via handleError if a write fails
+        self._last_record: logging.LogRecord | None = None
+        # Set when the buffer becomes non-empty (or on close) to wake the
+        # flusher; cleared under self.lock when the buffer is written out
+        self._pending = threading.Event()
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        with self.lock:
+            self._buffer.append(line)
+            self._buffered += len(line)
+            self._last_record = record
+            if self._buffered >= self.MAX_BUFFER or self._closed:
+                self._write_buffer()
+            elif len(self._buffer) == 1:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="console-log-flush", daemon=True
+                    )
+                    self._flusher.start()
+                self._pending.set()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write_buffer()
+
+    def close(self) -> None:
+        # Wake the flusher so it sees _closed and exits. It is not joined:
+        # logging.shutdown() calls close() with self.lock held, which the
+        # flusher needs for its final flush.
+        with self.lock:
+            self._closed = True
+            self._flusher = None
+            self._write_buffer()
+        self._pending.set()
+        super().close()
+
+    def _write_buffer(self) -> None:
+        # Caller holds self.lock.
+        self._pending.clear()
+        if not self._buffer:
+            return
+        data = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        try:
+            self.stream.write(data)
+            self.stream.flush()
+        except Exception:
+            self.handleError(self._last_record)
+
+    def _flush_loop(self) -> None:
+        pending = self._pending
+        while not self._closed:
+            pending.wait()
+            # Let records arriving shortly after the first share one write
+            time.sleep(self.FLUSH_INTERVAL)
+            self.flush()
+
+
+def _with_file_handler(
+    handlers: list[logging.Handler],
+    file_handler: logging.Handler | None,
+    *,
+    first: bool = False,
+) -> list[logging.Handler]:
+    """Add the file handler (when file logging is enabled) to a handler list."""
+    if file_handler is None:
+        return handlers
+    return [file_handler, *handlers] if first else [*handlers, file_handler]
+
+
+def _render_json(event_dict: dict[str, Any], **_: Any) -> str:
+    """JSONRenderer serializer backed by fast_json (orjson when installed).
+
+    Never drops a record: if the event cannot be encoded (e.g. tuple dict
+    keys or a circular reference), non-scalar values are rendered with repr().
+    """
+    try:
+        return fast_json.dumps_str(event_dict)
+    except (TypeError, ValueError):
+        return json.dumps(
+            {
+                str(key): value
+                if value is None or isinstance(value, (str, int, float, bool))
+                else repr(value)
+                for key, value in event_dict.items()
+            },
+            separators=(",", ":"),
+        )
 
 
 def _resolve_log_level(level: str | None) -> int:
-    candidate = (level or "info").upper()
-    value = logging.getLevelName(candidate)
-    return value if isinstance(value, int) else logging.INFO
+    return _LEVEL_NUMBERS.get((level or "info").lower(), logging.INFO)
 
 
 def configure_log_bridge(config: AppConfig, mqtt_client: Any) -> None:
     base_topic = (config.mqtt.base_topic or "smarttub-mqtt").rstrip("/")
-    forwarder = _MQTTForwarder(
-        config.logging.mqtt_forwarding, mqtt_client, f"{base_topic}/meta/logs"
-    )
+    processors: list[Any] = [structlog.processors.add_log_level, _add_timestamp]
+    # Only put the forwarder in the chain when it can forward at all, so a
+    # disabled bridge costs no call per event.
+    if config.logging.mqtt_forwarding and mqtt_client is not None:
+        processors.append(
+            _MQTTForwarder(
+                True,
+                mqtt_client,
+                f"{base_topic}/meta/logs",
+                min_level=_resolve_log_level(config.logging.mqtt_log_level),
+                fields=config.logging.mqtt_log_fields,
+                max_value_len=config.logging.mqtt_log_max_value_len,
+            )
+        )
+    processors.append(structlog.stdlib.ProcessorFormatter.wrap_for_formatter)
 
     min_level = _resolve_log_level(config.logging.level)
 
-    timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
-
-    # Set up file logging with rotation and ZIP compression
-    file_handlers = setup_file_logging(
-        log_dir=config.logging.log_dir,
-        log_max_size_mb=config.logging.log_max_size_mb,
-        log_max_files=config.logging.log_max_files,
-        log_compress=config.logging.log_compress,
-        log_level=min_level,
-    )
+    # Set up file logging with rotation and ZIP compression. Console-only
+    # setups skip it entirely so no log files are opened.
+    if config.logging.file_enabled:
+        file_handlers = setup_file_logging(
+            log_dir=config.logging.log_dir,
+            log_max_size_mb=config.logging.log_max_size_mb,
+            log_max_files=config.logging.log_max_files,
+            log_compress=config.logging.log_compress,
+            log_level=min_level,
+        )
+    else:
+        file_handlers = {}
 
     # Configure structlog to use standard logging
+    # The filtering wrapper drops events below min_level before any processor
+    # runs, and every stdlib logger configured below uses that same level, so
+    # a per-event filter_by_level (an isEnabledFor call) would be redundant.
+    # The forwarder applies its own, usually higher, threshold first thing.
     structlog.configure(
         wrapper_class=structlog.make_filtering_bound_logger(min_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.processors.add_log_level,
-            timestamper,
-            forwarder,
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
+        processors=processors,
     )
 
-    # Configure standard logging to also write to files
-    root_logger = logging.getLogger()
-    root_logger.setLevel(min_level)
-
-    # Remove existing handlers to avoid duplicates
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-
-    # Add console handler to root (all logs to console)
-    console_handler = logging.StreamHandler()
+    # Configure standard logging to also write to files; the console handler
+    # receives all logs
+    console_handler = _BufferedStreamHandler()
     console_handler.setLevel(min_level)
     console_formatter = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.processors.JSONRenderer(),
+        processor=structlog.processors.JSONRenderer(serializer=_render_json),
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
-
-    # Add default smarttub.log to root for catchall
-    root_logger.addHandler(file_handlers["smarttub"])
-
-    # Set up logger routing for specific modules with propagate=False to avoid duplicates
-    # MQTT logs go ONLY to mqtt.log
-    mqtt_logger = logging.getLogger("smarttub.mqtt")
-    mqtt_logger.setLevel(min_level)
-    mqtt_logger.propagate = False  # Don't propagate to root/parent
-    mqtt_logger.addHandler(file_handlers["mqtt"])
-    mqtt_logger.addHandler(console_handler)
-
-    # WebUI logs go ONLY to webui.log
-    webui_logger = logging.getLogger("smarttub.webui")
-    webui_logger.setLevel(min_level)
-    webui_logger.propagate = False
-    webui_logger.addHandler(file_handlers["webui"])
-    webui_logger.addHandler(console_handler)
-
-    # SmartTub API logs go ONLY to smarttub.log
-    api_logger = logging.getLogger("smarttub.api")
-    api_logger.setLevel(min_level)
-    api_logger.propagate = False
-    api_logger.addHandler(file_handlers["smarttub"])
-    api_logger.addHandler(console_handler)
-
-    # Core logs go ONLY to smarttub.log
-    core_logger = logging.getLogger("smarttub.core")
-    core_logger.setLevel(min_level)
-    core_logger.propagate = False
-    core_logger.addHandler(file_handlers["smarttub"])
-    core_logger.addHandler(console_handler)
-
-    # Uvicorn loggers go ONLY to webui.log
-    # Uvicorn uses its own loggers: uvicorn, uvicorn.access, uvicorn.error
-    uvicorn_logger = logging.getLogger("uvicorn")
-    uvicorn_logger.setLevel(min_level)
-    uvicorn_logger.propagate = False
-    uvicorn_logger.addHandler(file_handlers["webui"])
-    uvicorn_logger.addHandler(console_handler)
-
-    uvicorn_access_logger = logging.getLogger("uvicorn.access")
-    uvicorn_access_logger.setLevel(min_level)
-    uvicorn_access_logger.propagate = False
-    uvicorn_access_logger.addHandler(file_handlers["webui"])
-    uvicorn_access_logger.addHandler(console_handler)
-
-    uvicorn_error_logger = logging.getLogger("uvicorn.error")
-    uvicorn_error_logger.setLevel(min_level)
-    uvicorn_error_logger.propagate = False
-    uvicorn_error_logger.addHandler(file_handlers["webui"])
-    uvicorn_error_logger.addHandler(console_handler)
+
+    # Swap all handler lists under a single acquisition of the logging module
+    # lock (the same lock addHandler/removeHandler take per call). Assigning
+    # the lists replaces existing handlers, so reconfiguring never stacks
+    # duplicates.
+    root_logger = logging.getLogger()
+    replaced: set[logging.Handler] = set()
+    with logging._lock:
+        replaced.update(root_logger.handlers)
+        root_logger.setLevel(min_level)
+        # Root gets the console (all logs) plus smarttub.log as the catchall
+        root_logger.handlers = _with_file_handler(
+            [console_handler], file_handlers.get("smarttub")
+        )
+
+        # Logger routing for specific modules with propagate=False to avoid
+        # duplicates
+        for name, file_key in _LOGGER_ROUTES:
+            module_logger = logging.getLogger(name)
+            module_logger.setLevel(min_level)
+            module_logger.propagate = False  # Don't propagate to root/parent
+            replaced.update(module_logger.handlers)
+            module_logger.handlers = _with_file_handler(
+                [console_handler], file_handlers.get(file_key), first=True
+            )
+
+    # Stop the flusher threads of console handlers from a previous call
+    for handler in replaced:
+        if isinstance(handler, _BufferedStreamHandler):
+            handler.close()
 
 
 __all__ = ["configure_log_bridge", "CommandAuditLogger"]
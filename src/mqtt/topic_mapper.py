@@ -1,32 +1,176 @@
 from __future__ import annotations
 
-import json
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterator, List
 
 import yaml
+from src.core import fast_json
 from src.core.config_loader import AppConfig
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment]
+
 logger = logging.getLogger("smarttub.mqtt.mapper")
 
 
 class MQTTMessage:
     """Represents an MQTT message to be published."""
 
-    def __init__(self, topic: str, payload: str, qos: int = 1, retain: bool = True):
+    __slots__ = ("topic", "payload", "qos", "retain")
+
+    def __init__(
+        self, topic: str, payload: str | bytes, qos: int = 1, retain: bool = True
+    ):
         self.topic = topic
         self.payload = payload
         self.qos = qos
         self.retain = retain
 
 
+# Locations probed (in order) for the discovery results file
+_DISCOVERED_ITEMS_PATHS = (
+    Path("/config/discovered_items.yaml"),
+    Path("config/discovered_items.yaml"),
+    Path("discovered_items.yaml"),
+)
+
+# Marks the entity-id leaf in a field table: its payload is the resolved id.
+_ENTITY_ID = object()
+
+# Snapshot read topics per component, in publish order. Each entry is
+# (field, default): a None default publishes the field only when present,
+# otherwise str(data.get(field, default)) is always published.
+_HEATER_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("state", "unknown"),
+    ("temperature", None),
+    ("target_temperature", None),
+    ("mode", None),
+)
+_SPA_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("state", "unknown"),
+    ("water_temperature", None),
+    ("air_temperature", None),
+)
+_PUMP_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("state", "unknown"),
+    ("id", _ENTITY_ID),
+    ("type", "unknown"),
+    ("speed", None),
+)
+_LIGHT_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("state", "unknown"),
+    ("mode", None),
+    ("color", None),
+    ("brightness", None),
+)
+
+
+# Topic leaves per pump/light: read topics, timestamp, meta and the write
+# topics documented in the meta payload.
+_PUMP_LEAVES = tuple(name for name, _ in _PUMP_FIELDS) + (
+    "last_updated",
+    "meta",
+    "state_writetopic",
+)
+_LIGHT_LEAVES = tuple(name for name, _ in _LIGHT_FIELDS) + (
+    "last_updated",
+    "meta",
+    "state_writetopic",
+    "mode_writetopic",
+    "color_writetopic",
+    "brightness_writetopic",
+)
+
+
+def _field_payloads(
+    data: dict[str, Any], fields: tuple[tuple[str, Any], ...], entity_id: Any = None
+) -> Iterator[tuple[str, str]]:
+    """Yield (field, RAW payload) pairs for the fields of a component table."""
+    get = data.get
+    for leaf, default in fields:
+        if default is _ENTITY_ID:
+            yield leaf, str(entity_id)
+            continue
+        value = get(leaf, default)
+        if value is None and default is None:
+            continue
+        yield leaf, str(value)
+
+
+@dataclass(frozen=True)
+class _TopicPrefixes:
+    """Fixed snapshot topics for one spa base topic, built once and reused."""
+
+    heater: dict[str, str]  # leaf -> full topic
+    spa: dict[str, str]  # leaf -> full topic
+    pumps: str  # "<base>/pumps/" - append "<pump_id>/<leaf>"
+    pumps_last_updated: str
+    lights: str  # "<base>/lights/" - append "<light_id>/<leaf>"
+    lights_last_updated: str
+    # Per-entity leaf -> topic dicts, filled as pump/light ids are first seen
+    pump_topics: dict[Any, dict[str, str]] = field(default_factory=dict)
+    light_topics: dict[Any, dict[str, str]] = field(default_factory=dict)
+
+    def pump(self, pump_id: Any) -> dict[str, str]:
+        """Return the leaf -> topic dict for one pump, building it on first use."""
+        topics = self.pump_topics.get(pump_id)
+        if topics is None:
+            prefix = f"{self.pumps}{pump_id}/"
+            topics = self.pump_topics[pump_id] = {
+                leaf: prefix + leaf for leaf in _PUMP_LEAVES
+            }
+        return topics
+
+    def light(self, light_id: Any) -> dict[str, str]:
+        """Return the leaf -> topic dict for one light, building it on first use."""
+        topics = self.light_topics.get(light_id)
+        if topics is None:
+            prefix = f"{self.lights}{light_id}/"
+            topics = self.light_topics[light_id] = {
+                leaf: prefix + leaf for leaf in _LIGHT_LEAVES
+            }
+        return topics
+
+    @classmethod
+    def for_base(cls, base_topic: str) -> "_TopicPrefixes":
+        heater = f"{base_topic}/heater/"
+        spa = f"{base_topic}/spa/"
+        pumps = f"{base_topic}/pumps/"
+        lights = f"{base_topic}/lights/"
+        heater_leaves = [name for name, _ in _HEATER_FIELDS] + [
+            "last_updated",
+            "meta",
+            "target_temperature_writetopic",
+            "mode_writetopic",
+        ]
+        spa_leaves = [name for name, _ in _SPA_FIELDS] + ["last_updated"]
+        return cls(
+            heater={leaf: heater + leaf for leaf in heater_leaves},
+            spa={leaf: spa + leaf for leaf in spa_leaves},
+            pumps=pumps,
+            pumps_last_updated=pumps + "last_updated",
+            lights=lights,
+            lights_last_updated=lights + "last_updated",
+        )
+
+
 class MQTTTopicMapper:
     """Maps SmartTub state snapshots to MQTT topic/payload messages."""
 
     def __init__(self, config: AppConfig, mqtt_client: Any):
         self.config = config
         self.mqtt_client = mqtt_client
+        # Snapshot topics per spa base topic; spas are few and fixed at runtime
+        self._topic_prefixes: dict[str, _TopicPrefixes] = {}
+        # Parsed discovered_items.yaml as (path, mtime, data); reparsed on change
+        self._discovered_items_cache: tuple[Path, float, Any] | None = None
+        # (topic, payload) pairs for the version meta topics, resolved once
+        self._version_meta: tuple[tuple[str, str], ...] | None = None
+        self._discovery_control_topic = f"{config.mqtt.base_topic}/discovery/control"
 
     def publish_state_snapshot(self, snapshot: dict[str, Any]) -> List[MQTTMessage]:
         """Convert a state snapshot into MQTT messages for publishing.
@@ -53,6 +197,11 @@ class MQTTTopicMapper:
             base_topic = f"{self.config.mqtt.base_topic}/{spa_id}"
         else:
             base_topic = self.config.mqtt.base_topic
+        topics = self._topic_prefixes.get(base_topic)
+        if topics is None:
+            topics = self._topic_prefixes[base_topic] = _TopicPrefixes.for_base(
+                base_topic
+            )
         timestamp = snapshot.get("timestamp", "")
 
         # T053: Skip aggregated component state topics with JSON - publish only RAW data
@@ -63,68 +212,41 @@ class MQTTTopicMapper:
         components = snapshot.get("components", {})
 
         # DEBUG: Log what components we have
-        logger.debug(f"Publishing snapshot with components: {list(components.keys())}")
-        if "pumps" in components:
-            pumps_list = components.get("pumps")
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Pumps in snapshot: {len(pumps_list) if isinstance(pumps_list, list) else 'NOT A LIST'} items"
-            )
-        if "lights" in components:
-            lights_list = components.get("lights")
-            logger.debug(
-                f"Lights in snapshot: {len(lights_list) if isinstance(lights_list, list) else 'NOT A LIST'} items"
+                "Publishing snapshot with components: %s", list(components.keys())
             )
+            for name in ("pumps", "lights"):
+                if name in components:
+                    items = components[name]
+                    logger.debug(
+                        "%s in snapshot: %s items",
+                        name.capitalize(),
+                        len(items) if isinstance(items, list) else "NOT A LIST",
+                    )
+
+        append = messages.append
+        extend = messages.extend
+        timestamp_payload = str(timestamp)
+        # last_updated topics are overwritten by the next snapshot, so they
+        # default to QoS 0 (still retained) to skip the PUBACK round-trip
+        timestamp_qos = self.config.mqtt.timestamp_qos
 
         # Heater: simple state and temperature topics, plus one last_updated topic
         # Following T052: Separate read topics (current API values) from write topics
         heater = components.get("heater")
         if isinstance(heater, dict):
-            # state as plain string (read-only, current API value)
-            messages.append(
-                MQTTMessage(
-                    topic=f"{base_topic}/heater/state",
-                    payload=str(heater.get("state", "unknown")),
-                    qos=1,
-                    retain=True,
-                )
+            heater_topics = topics.heater
+            extend(
+                [
+                    MQTTMessage(heater_topics[leaf], payload)
+                    for leaf, payload in _field_payloads(heater, _HEATER_FIELDS)
+                ]
             )
-            # temperature as plain numeric or string (read-only, current API value)
-            if heater.get("temperature") is not None:
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/heater/temperature",
-                        payload=str(heater.get("temperature")),
-                        qos=1,
-                        retain=True,
-                    )
-                )
-            # target_temperature: current API value (read)
-            if heater.get("target_temperature") is not None:
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/heater/target_temperature",
-                        payload=str(heater.get("target_temperature")),
-                        qos=1,
-                        retain=True,
-                    )
-                )
-            # mode: current API value (read)
-            if heater.get("mode") is not None:
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/heater/mode",
-                        payload=str(heater.get("mode")),
-                        qos=1,
-                        retain=True,
-                    )
-                )
             # single top-level timestamp for heater
-            messages.append(
+            append(
                 MQTTMessage(
-                    topic=f"{base_topic}/heater/last_updated",
-                    payload=str(timestamp),
-                    qos=1,
-                    retain=True,
+                    heater_topics["last_updated"], timestamp_payload, timestamp_qos
                 )
             )
 
@@ -138,16 +260,14 @@ class MQTTTopicMapper:
                         "mode": heater.get("mode") is not None,
                     },
                     # T052: publish the recommended command topics for heater
-                    "target_temperature_writetopic": f"{base_topic}/heater/target_temperature_writetopic",
-                    "mode_writetopic": f"{base_topic}/heater/mode_writetopic",
+                    "target_temperature_writetopic": heater_topics[
+                        "target_temperature_writetopic"
+                    ],
+                    "mode_writetopic": heater_topics["mode_writetopic"],
                     "last_updated": timestamp,
                 }
-                topic_meta = f"{base_topic}/heater/meta"
-                messages.append(
-                    MQTTMessage(
-                        topic=topic_meta, payload=json.dumps(meta), qos=1, retain=True
-                    )
-                )
+                topic_meta = heater_topics["meta"]
+                append(MQTTMessage(topic_meta, fast_json.dumps(meta)))
                 logger.info(
                     "created-heater-meta", extra={"topic": topic_meta, "spa_id": spa_id}
                 )
@@ -158,89 +278,37 @@ class MQTTTopicMapper:
         # Spa: overall state and temperature readings + one last_updated
         spa = components.get("spa")
         if isinstance(spa, dict):
-            messages.append(
-                MQTTMessage(
-                    topic=f"{base_topic}/spa/state",
-                    payload=str(spa.get("state", "unknown")),
-                    qos=1,
-                    retain=True,
-                )
+            spa_topics = topics.spa
+            extend(
+                [
+                    MQTTMessage(spa_topics[leaf], payload)
+                    for leaf, payload in _field_payloads(spa, _SPA_FIELDS)
+                ]
             )
-            if spa.get("water_temperature") is not None:
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/spa/water_temperature",
-                        payload=str(spa.get("water_temperature")),
-                        qos=1,
-                        retain=True,
-                    )
-                )
-            if spa.get("air_temperature") is not None:
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/spa/air_temperature",
-                        payload=str(spa.get("air_temperature")),
-                        qos=1,
-                        retain=True,
-                    )
-                )
-            messages.append(
+            append(
                 MQTTMessage(
-                    topic=f"{base_topic}/spa/last_updated",
-                    payload=str(timestamp),
-                    qos=1,
-                    retain=True,
+                    spa_topics["last_updated"], timestamp_payload, timestamp_qos
                 )
             )
 
-        # Pumps: publish aggregated list (already done) and per-pump simple topics; one pumps/last_updated
+        # Pumps: per-pump simple topics and meta; one pumps/last_updated
         pumps = components.get("pumps")
         if isinstance(pumps, list):
             for pump in pumps:
                 pid = pump.get("id") or pump.get("pumpId") or "unknown"
-                # state -> plain
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/pumps/{pid}/state",
-                        payload=str(pump.get("state", "unknown")),
-                        qos=1,
-                        retain=True,
-                    )
-                )
-                # id and type as separate simple topics for easy discovery
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/pumps/{pid}/id",
-                        payload=str(pid),
-                        qos=1,
-                        retain=True,
-                    )
-                )
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/pumps/{pid}/type",
-                        payload=str(pump.get("type", "unknown")),
-                        qos=1,
-                        retain=True,
-                    )
+                pump_topics = topics.pump(pid)
+                # state, id, type and speed as plain values; id and type as
+                # separate simple topics for easy discovery
+                extend(
+                    [
+                        MQTTMessage(pump_topics[leaf], payload)
+                        for leaf, payload in _field_payloads(pump, _PUMP_FIELDS, pid)
+                    ]
                 )
-                # speed -> plain
-                if pump.get("speed") is not None:
-                    messages.append(
-                        MQTTMessage(
-                            topic=f"{base_topic}/pumps/{pid}/speed",
-                            payload=str(pump.get("speed")),
-                            qos=1,
-                            retain=True,
-                        )
-                    )
                 # last_updated per pump
-                messages.append(
+                append(
                     MQTTMessage(
-                        topic=f"{base_topic}/pumps/{pid}/last_updated",
-                        payload=str(timestamp),
-                        qos=1,
-                        retain=True,
+                        pump_topics["last_updated"], timestamp_payload, timestamp_qos
                     )
                 )
                 # per-pump retained meta topic describing the pump and where to
@@ -255,18 +323,11 @@ class MQTTTopicMapper:
                             "speed": pump.get("speed") is not None,
                         },
                         # T052: publish the recommended command topic for this pump
-                        "state_writetopic": f"{base_topic}/pumps/{pid}/state_writetopic",
+                        "state_writetopic": pump_topics["state_writetopic"],
                         "last_updated": timestamp,
                     }
-                    topic_meta = f"{base_topic}/pumps/{pid}/meta"
-                    messages.append(
-                        MQTTMessage(
-                            topic=topic_meta,
-                            payload=json.dumps(meta),
-                            qos=1,
-                            retain=True,
-                        )
-                    )
+                    topic_meta = pump_topics["meta"]
+                    append(MQTTMessage(topic_meta, fast_json.dumps(meta)))
                     # Info-level log so operators can see meta topics even when
                     # logger is set to INFO (debug logs are more verbose).
                     logger.info(
@@ -277,13 +338,8 @@ class MQTTTopicMapper:
                     # don't let a meta serialization error break snapshot publish
                     pass
             # pumps top-level timestamp
-            messages.append(
-                MQTTMessage(
-                    topic=f"{base_topic}/pumps/last_updated",
-                    payload=str(timestamp),
-                    qos=1,
-                    retain=True,
-                )
+            append(
+                MQTTMessage(topics.pumps_last_updated, timestamp_payload, timestamp_qos)
             )
 
             # No legacy (non-spa) per-pump topics are published anymore; prefer
@@ -294,109 +350,71 @@ class MQTTTopicMapper:
         # T053: Include mode for special light modes (LowSpeedWheel, ColorWheel, etc.)
         lights = components.get("lights")
         if isinstance(lights, list):
+            # Detected modes for all lights, resolved once per snapshot
+            modes_by_id = self._load_all_detected_modes(spa_id) if lights else {}
             for light in lights:
                 lid = light.get("id") or f"zone_{light.get('zone', 'unknown')}"
-                # Read topic: current state from API (on/off)
-                messages.append(
-                    MQTTMessage(
-                        topic=f"{base_topic}/lights/{lid}/state",
-                        payload=str(light.get("state", "unknown")),
-                        qos=1,
-                        retain=True,
-                    )
+                light_topics = topics.light(lid)
+                # Read topics: current state, mode (OFF, WHITE, PURPLE,
+                # LowSpeedWheel, ColorWheel, etc.), color and brightness
+                extend(
+                    [
+                        MQTTMessage(light_topics[leaf], payload)
+                        for leaf, payload in _field_payloads(light, _LIGHT_FIELDS)
+                    ]
                 )
-                # Read topic: current mode from API (OFF, WHITE, PURPLE, LowSpeedWheel, ColorWheel, etc.)
-                if light.get("mode") is not None:
-                    messages.append(
-                        MQTTMessage(
-                            topic=f"{base_topic}/lights/{lid}/mode",
-                            payload=str(light.get("mode")),
-                            qos=1,
-                            retain=True,
-                        )
-                    )
-                # Read topic: current color from API
-                if light.get("color") is not None:
-                    messages.append(
-                        MQTTMessage(
-                            topic=f"{base_topic}/lights/{lid}/color",
-                            payload=str(light.get("color")),
-                            qos=1,
-                            retain=True,
-                        )
-                    )
-                # Read topic: current brightness from API
-                if light.get("brightness") is not None:
-                    messages.append(
-                        MQTTMessage(
-                            topic=f"{base_topic}/lights/{lid}/brightness",
-                            payload=str(light.get("brightness")),
-                            qos=1,
-                            retain=True,
-                        )
-                    )
                 # Per-light timestamp
-                messages.append(
+                append(
                     MQTTMessage(
-                        topic=f"{base_topic}/lights/{lid}/last_updated",
-                        payload=str(timestamp),
-                        qos=1,
-                        retain=True,
+                        light_topics["last_updated"], timestamp_payload, timestamp_qos
                     )
                 )
 
                 # T052: per-light meta topic documenting write topics for OpenHAB
                 try:
-                    # Load detected_modes from YAML if available
-                    detected_modes = self._load_detected_modes_for_light(spa_id, lid)
+                    # detected_modes from YAML if available
+                    detected_modes = modes_by_id.get(lid, [])
+                    has_mode = light.get("mode") is not None
+                    has_color = light.get("color") is not None
+                    has_brightness = light.get("brightness") is not None
 
                     meta = {
                         "id": lid,
                         "zone": light.get("zone"),
                         "supports": {
                             "state": True,
-                            "mode": light.get("mode") is not None,
-                            "color": light.get("color") is not None,
-                            "brightness": light.get("brightness") is not None,
+                            "mode": has_mode,
+                            "color": has_color,
+                            "brightness": has_brightness,
                         },
                         # T052: publish the recommended command topics for this light
-                        "state_writetopic": f"{base_topic}/lights/{lid}/state_writetopic",
-                        "mode_writetopic": f"{base_topic}/lights/{lid}/mode_writetopic"
-                        if light.get("mode") is not None
+                        "state_writetopic": light_topics["state_writetopic"],
+                        "mode_writetopic": light_topics["mode_writetopic"]
+                        if has_mode
                         else None,
-                        "color_writetopic": f"{base_topic}/lights/{lid}/color_writetopic"
-                        if light.get("color") is not None
+                        "color_writetopic": light_topics["color_writetopic"]
+                        if has_color
                         else None,
-                        "brightness_writetopic": f"{base_topic}/lights/{lid}/brightness_writetopic"
-                        if light.get("brightness") is not None
+                        "brightness_writetopic": light_topics["brightness_writetopic"]
+                        if has_brightness
                         else None,
                         "detected_modes": detected_modes,  # Add detected modes from YAML
                         "last_updated": timestamp,
                     }
-                    topic_meta = f"{base_topic}/lights/{lid}/meta"
-                    messages.append(
-                        MQTTMessage(
-                            topic=topic_meta,
-                            payload=json.dumps(meta),
-                            qos=1,
-                            retain=True,
-                        )
-                    )
+                    topic_meta = light_topics["meta"]
+                    append(MQTTMessage(topic_meta, fast_json.dumps(meta)))
                     logger.info(
                         "created-light-meta",
                         extra={"topic": topic_meta, "spa_id": spa_id, "light_id": lid},
                     )
                 except Exception as e:
                     # don't let a meta serialization error break snapshot publish
-                    logger.warning(f"Error creating light meta for {lid}: {e}")
+                    logger.warning("Error creating light meta for %s: %s", lid, e)
                     pass
 
-            messages.append(
+            append(
                 MQTTMessage(
-                    topic=f"{base_topic}/lights/last_updated",
-                    payload=str(timestamp),
-                    qos=1,
-                    retain=True,
+                    topics.lights_last_updated, timestamp_payload, timestamp_qos
                 )
             )
 
@@ -408,35 +426,52 @@ class MQTTTopicMapper:
     def publish_messages(self, messages: List[MQTTMessage]) -> None:
         """Publish a list of MQTT messages.
 
+        Uses the client's ``publish_many`` batch API when available and logs a
+        single INFO line per batch; per-message details are logged at DEBUG.
+
         Args:
             messages: List of messages to publish
         """
         logger = logging.getLogger(__name__)
+        if not messages:
+            return
 
-        for message in messages:
-            try:
-                # Log intent before publish to make it visible in logs even if the
-                # broker drops the connection immediately after.
-                try:
-                    payload_len = (
-                        len(message.payload) if message.payload is not None else 0
-                    )
-                except Exception:
-                    payload_len = None
-
-                # Also emit an INFO log so retained/meta messages and normal
-                # publishes are visible at INFO level (not only DEBUG).
-                logger.info(
+        if logger.isEnabledFor(logging.DEBUG):
+            for message in messages:
+                logger.debug(
                     "publishing-mqtt-message",
                     extra={
                         "topic": message.topic,
-                        "payload_len": payload_len,
+                        "payload_len": _payload_len(message.payload),
                         "qos": message.qos,
                         "retain": message.retain,
                     },
                 )
 
-                self.mqtt_client.publish(
+        # Log intent before publish to make it visible in logs even if the
+        # broker drops the connection immediately after.
+        logger.info(
+            "publishing-mqtt-batch",
+            extra={
+                "count": len(messages),
+                "total_bytes": sum(_payload_len(m.payload) for m in messages),
+            },
+        )
+
+        publish_many = getattr(self.mqtt_client, "publish_many", None)
+        if publish_many is not None:
+            try:
+                publish_many(messages)
+            except Exception as e:
+                logger.warning(
+                    "mqtt-publish-error", exc_info=e, extra={"count": len(messages)}
+                )
+            return
+
+        publish = self.mqtt_client.publish
+        for message in messages:
+            try:
+                publish(
                     topic=message.topic,
                     payload=message.payload,
                     qos=message.qos,
@@ -444,9 +479,7 @@ class MQTTTopicMapper:
                 )
             except Exception as e:
                 logger.warning(
-                    "mqtt-publish-error",
-                    exc_info=e,
-                    extra={"topic": getattr(message, "topic", None)},
+                    "mqtt-publish-error", exc_info=e, extra={"topic": message.topic}
                 )
 
     def publish_capability_meta(
@@ -466,7 +499,7 @@ class MQTTTopicMapper:
         else:
             topic = f"{base_topic}/spa/{spa_id}/capability/meta"
 
-        payload = json.dumps(capability_profile)
+        payload = fast_json.dumps(capability_profile)
         return MQTTMessage(topic=topic, payload=payload, qos=1, retain=True)
 
     def publish_capability_meta_entries(
@@ -495,7 +528,7 @@ class MQTTTopicMapper:
             if isinstance(value, (str, int, float, bool)) or value is None:
                 payload = "" if value is None else str(value)
             else:
-                payload = json.dumps(value)
+                payload = fast_json.dumps(value)
 
             topic = f"{base}/{key}"
             messages.append(
@@ -514,104 +547,103 @@ class MQTTTopicMapper:
         Returns:
             List of MQTT messages with version information
         """
-        from src.core.version import get_version_info
+        if self._version_meta is None:
+            # Versions cannot change within a process; look them up once
+            from src.core.version import get_version_info
 
-        version_info = get_version_info()
-
-        messages = []
-
-        # Publish smarttub-mqtt version to meta/smarttub-mqtt
-        topic_smarttub_mqtt = f"{self.config.mqtt.base_topic}/meta/smarttub-mqtt"
-        payload_smarttub_mqtt = version_info["smarttub_mqtt"]
-        messages.append(
-            MQTTMessage(
-                topic=topic_smarttub_mqtt,
-                payload=payload_smarttub_mqtt,
-                qos=1,
-                retain=True,
+            version_info = get_version_info()
+            base_topic = self.config.mqtt.base_topic
+            self._version_meta = (
+                # smarttub-mqtt version to meta/smarttub-mqtt
+                (f"{base_topic}/meta/smarttub-mqtt", version_info["smarttub_mqtt"]),
+                # python-smarttub version to meta/python-smarttub
+                (
+                    f"{base_topic}/meta/python-smarttub",
+                    version_info["python_smarttub"],
+                ),
             )
-        )
 
-        # Publish python-smarttub version to meta/python-smarttub
-        topic_python_smarttub = f"{self.config.mqtt.base_topic}/meta/python-smarttub"
-        payload_python_smarttub = version_info["python_smarttub"]
-        messages.append(
-            MQTTMessage(
-                topic=topic_python_smarttub,
-                payload=payload_python_smarttub,
-                qos=1,
-                retain=True,
-            )
-        )
+        return [
+            MQTTMessage(topic=topic, payload=payload, qos=1, retain=True)
+            for topic, payload in self._version_meta
+        ]
 
-        return messages
+    def _load_discovered_items(self) -> Any:
+        """Return the parsed discovered_items.yaml, or None if it does not exist.
 
-    def _load_detected_modes_for_light(self, spa_id: str, light_id: str) -> List[str]:
-        """Load detected_modes from discovered_items.yaml for a specific light.
+        The parsed data is cached and only re-read when the file's mtime (or
+        the path found) changes, so lights share one parse per file version.
+        """
+        for path in _DISCOVERED_ITEMS_PATHS:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            cached = self._discovered_items_cache
+            if cached is not None and cached[0] == path and cached[1] == mtime:
+                return cached[2]
+            logger.debug("Found YAML at %s", path)
+            with open(path, "r") as f:
+                data = yaml.load(f, Loader=_YAMLLoader)
+            self._discovered_items_cache = (path, mtime, data)
+            return data
+        return None
+
+    def _load_all_detected_modes(self, spa_id: str) -> dict[Any, List[str]]:
+        """Load detected_modes for every light of a spa from discovered_items.yaml.
 
         Args:
             spa_id: The spa identifier
-            light_id: The light identifier (e.g., "zone_1")
 
         Returns:
-            List of detected modes, empty if none found
+            Mapping of light id to its detected modes, empty if none found
         """
         try:
-            # Try multiple paths where the YAML might be
-            yaml_paths = [
-                Path("/config/discovered_items.yaml"),
-                Path("config/discovered_items.yaml"),
-                Path("discovered_items.yaml"),
-            ]
-
-            yaml_path = None
-            for path in yaml_paths:
-                if path.exists():
-                    yaml_path = path
-                    logger.debug(f"Found YAML at {yaml_path}")
-                    break
-
-            if not yaml_path:
-                logger.debug(f"No discovered_items.yaml found for {spa_id}/{light_id}")
-                return []
-
-            # Load YAML file
-            with open(yaml_path, "r") as f:
-                data = yaml.safe_load(f)
+            data = self._load_discovered_items()
+            if data is None:
+                logger.debug("No discovered_items.yaml found for %s", spa_id)
+                return {}
 
             if not data or "discovered_items" not in data:
-                logger.debug(f"No discovered_items key in YAML for {spa_id}/{light_id}")
-                return []
+                logger.debug("No discovered_items key in YAML for %s", spa_id)
+                return {}
 
             # Get spa data
             spa_data = data["discovered_items"].get(spa_id)
             if not spa_data:
-                logger.debug(f"No spa data found for {spa_id} in YAML")
-                return []
+                logger.debug("No spa data found for %s in YAML", spa_id)
+                return {}
 
             # Get lights data
             lights = spa_data.get("lights", [])
             if not lights:
-                logger.debug(f"No lights found for {spa_id} in YAML")
-                return []
+                logger.debug("No lights found for %s in YAML", spa_id)
+                return {}
 
-            # Find the specific light by ID
+            # Index by light ID in one pass; the first entry for an ID wins
+            modes_by_id: dict[Any, List[str]] = {}
             for light in lights:
-                if light.get("id") == light_id:
-                    detected = light.get("detected_modes", [])
-                    logger.debug(
-                        f"Found detected_modes for {spa_id}/{light_id}: {detected}"
+                if isinstance(light, dict):
+                    modes_by_id.setdefault(
+                        light.get("id"), light.get("detected_modes", [])
                     )
-                    return detected
-
-            logger.debug(f"Light {light_id} not found for {spa_id} in YAML")
-            return []
+            return modes_by_id
 
         except Exception as e:
-            logger.debug(
-                f"Error loading detected_modes from YAML for {spa_id}/{light_id}: {e}"
-            )
-            return []
+            logger.debug("Error loading detected_modes from YAML for %s: %s", spa_id, e)
+            return {}
+
+    def _load_detected_modes_for_light(self, spa_id: str, light_id: str) -> List[str]:
+        """Load detected_modes from discovered_items.yaml for a specific light.
+
+        Args:
+            spa_id: The spa identifier
+            light_id: The light identifier (e.g., "zone_1")
+
+        Returns:
+            List of detected modes, empty if none found
+        """
+        return self._load_all_detected_modes(spa_id).get(light_id, [])
 
     def publish_discovery_status(self, state: Any) -> List[MQTTMessage]:
         """
@@ -651,7 +683,7 @@ class MQTTTopicMapper:
 
         # Status topic (not retained - current state)
         topic_status = f"{base_topic}/discovery/status"
-        payload_status = json.dumps(status_data, indent=2)
+        payload_status = fast_json.dumps_pretty(status_data)
         messages.append(
             MQTTMessage(
                 topic=topic_status,
@@ -674,7 +706,7 @@ class MQTTTopicMapper:
             }
 
             topic_result = f"{base_topic}/discovery/result"
-            payload_result = json.dumps(result_data, indent=2)
+            payload_result = fast_json.dumps_pretty(result_data)
             messages.append(
                 MQTTMessage(
                     topic=topic_result,
@@ -684,7 +716,7 @@ class MQTTTopicMapper:
                 )
             )
 
-        logger.debug(f"Publishing discovery status: {state.status.value}")
+        logger.debug("Publishing discovery status: %s", state.status.value)
         return messages
 
     def get_discovery_control_topic(self) -> str:
@@ -694,7 +726,15 @@ class MQTTTopicMapper:
         Returns:
             Control topic path
         """
-        return f"{self.config.mqtt.base_topic}/discovery/control"
+        return self._discovery_control_topic
+
+
+def _payload_len(payload: Any) -> int:
+    """Size of a message payload for logging (0 for None or non-sized values)."""
+    try:
+        return len(payload) if payload is not None else 0
+    except TypeError:
+        return 0
 
 
 # Convenience function for backward compatibility with tests
@@ -713,10 +753,5 @@ def publish_state_snapshot(
     Returns:
         List of MQTT messages to publish
     """
-
-    # Create a dummy client for this function (not used in message creation)
-    class DummyClient:
-        pass
-
-    mapper = MQTTTopicMapper(config, DummyClient())
-    return mapper.publish_state_snapshot(snapshot)
+    # Message building never touches the MQTT client, so none is needed
+    return MQTTTopicMapper(config, None).publish_state_snapshot(snapshot)
@@ -1,25 +1,79 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
 import logging
+import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+import jinja2
+import yaml
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel
 from starlette.requests import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.core import fast_json
 from src.core.capability_detector import CapabilityDetector
 from src.core.config_loader import AppConfig
+from src.core.error_tracker import ErrorCategory
 from src.core.state_manager import StateManager
 from src.core.smarttub_client import SmartTubClient
+from src.core.version import get_version_info
 from src.web.auth import BasicAuthMiddleware
 
 logger = logging.getLogger(__name__)
 
+_STATIC_DIR = "src/web/static"
+
+
+def _static_dir_has_files(path: str) -> bool:
+    """Return True if the static directory exists and is not empty."""
+    if not os.path.isdir(path):
+        return False
+    with os.scandir(path) as entries:
+        return any(entries)
+
+
+# Probed once at import; the static directory is part of the deployed tree and
+# does not change while the process runs.
+_STATIC_MOUNTABLE = _static_dir_has_files(_STATIC_DIR)
+
+
+class TemperatureCommand(BaseModel):
+    """Body of POST /api/commands/set_temperature."""
+
+    temperature: float
+
+
+class HeatModeCommand(BaseModel):
+    """Body of POST /api/commands/set_heat_mode."""
+
+    mode: str
+
+
+class StateCommand(BaseModel):
+    """Body of the pump and light on/off commands."""
+
+    state: str
+
+
+class LightColorCommand(BaseModel):
+    """Body of POST /api/commands/set_light_color."""
+
+    color: str
+
+
+class LightBrightnessCommand(BaseModel):
+    """Body of POST /api/commands/set_light_brightness."""
+
+    # Floats are accepted and truncated, as int() did before body validation
+    brightness: int | float
+
 
 class WebApp:
     """Web application for SmartTub monitoring and control."""
@@ -41,12 +95,21 @@ class WebApp:
         self.error_tracker = error_tracker  # T058
         self.progress_tracker = progress_tracker  # T059
         self.discovery_coordinator = discovery_coordinator  # Background Discovery
+        # Response timestamp refreshed once per second while the app is served
+        self._now_iso: str | None = None
+        # Last state snapshot served by /api/state and its encoded body.
+        # StateManager replaces snapshots rather than mutating them, so the
+        # body stays valid for as long as the same object is current.
+        self._state_cache: tuple[Dict[str, Any], bytes] | None = None
 
         # Create lifespan context manager for graceful shutdown
         @asynccontextmanager
         async def lifespan(app: FastAPI):
             # Startup
+            clock_task = asyncio.create_task(self._tick_clock())
             yield
+            clock_task.cancel()
+            self._now_iso = None
             # Shutdown - suppress CancelledError during shutdown
             logger.info("Web UI shutting down gracefully")
 
@@ -60,34 +123,47 @@ class WebApp:
         # Add Basic Auth middleware if enabled (T056)
         if config.web.auth_enabled:
             if config.web.basic_auth_username and config.web.basic_auth_password:
-                auth_middleware = BasicAuthMiddleware(
+                self.app.add_middleware(
+                    BasicAuthMiddleware,
                     username=config.web.basic_auth_username,
                     password=config.web.basic_auth_password,
                 )
-                self.app.add_middleware(BaseHTTPMiddleware, dispatch=auth_middleware)
 
         # Mount static files (only if directory exists and has content)
-        import os
-
-        static_dir = "src/web/static"
-        if os.path.exists(static_dir) and os.path.isdir(static_dir):
-            # Check if directory has any files
-            if any(os.scandir(static_dir)):
-                self.app.mount(
-                    "/static", StaticFiles(directory=static_dir), name="static"
-                )
-
-        # Setup templates
-        self.templates = Jinja2Templates(directory="src/web/templates")
+        if _STATIC_MOUNTABLE:
+            self.app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static")
+
+        # Setup templates. Compiled templates stay cached; only re-stat the
+        # files on each render when template reloading is enabled.
+        template_env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader("src/web/templates"),
+            autoescape=jinja2.select_autoescape(),
+            auto_reload=config.web.template_reload,
+        )
+        self.templates = Jinja2Templates(env=template_env)
 
         # Register routes
         self._setup_routes()
 
+    async def _tick_clock(self) -> None:
+        """Refresh the cached response timestamp once per second."""
+        while True:
+            self._now_iso = datetime.now(timezone.utc).isoformat()
+            await asyncio.sleep(1)
+
+    def _now(self) -> str:
+        """Return the current UTC time as ISO string (up to one second stale)."""
+        now_iso = self._now_iso
+        if now_iso is None:
+            # Clock task not running (app not started via its lifespan)
+            return datetime.now(timezone.utc).isoformat()
+        return now_iso
+
     def _setup_routes(self) -> None:
         """Setup API and UI routes."""
 
         @self.app.get("/api/state", response_model=Dict[str, Any])
-        async def get_state() -> Dict[str, Any]:
+        async def get_state() -> Any:
             """Get current SmartTub state snapshot."""
             try:
                 # Get current state from state manager
@@ -96,7 +172,13 @@ class WebApp:
                     # Return safe fallback if no state available
                     return self.state_manager.get_safe_fallback_state()
 
-                return snapshot
+                # Encode each snapshot once; polls between state syncs reuse
+                # the cached body.
+                cached = self._state_cache
+                if cached is None or cached[0] is not snapshot:
+                    cached = (snapshot, fast_json.dumps(snapshot))
+                    self._state_cache = cached
+                return Response(cached[1], media_type="application/json")
             except Exception as e:
                 raise HTTPException(
                     status_code=500, detail=f"Failed to get state: {str(e)}"
@@ -108,17 +190,12 @@ class WebApp:
             try:
                 if self.capability_detector:
                     # Get all known spas and their capabilities
-                    spas_capabilities = {}
-                    for spa_id in list(
-                        self.capability_detector._capabilities_cache.keys()
-                    ):
-                        capability_profile = (
-                            self.capability_detector.get_capability_profile(spa_id)
-                        )
-                        spas_capabilities[spa_id] = capability_profile
+                    spas_capabilities = (
+                        self.capability_detector.get_all_capability_profiles()
+                    )
 
                     return {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "spas": spas_capabilities,
                         "mqtt_topics": {
                             "base_topic": self.config.mqtt.base_topic,
@@ -131,7 +208,7 @@ class WebApp:
                 else:
                     # Fallback to static capabilities if detector not available
                     return {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "spas": {},
                         "mqtt_topics": {
                             "base_topic": self.config.mqtt.base_topic,
@@ -144,13 +221,14 @@ class WebApp:
                     status_code=500, detail=f"Failed to get capabilities: {str(e)}"
                 )
 
+        # Page handlers are plain functions: they read YAML from disk and
+        # render Jinja templates synchronously, so FastAPI runs them in its
+        # threadpool instead of blocking the event loop.
         @self.app.get("/", response_class=HTMLResponse)
-        async def overview(request: Request) -> HTMLResponse:
+        def overview(request: Request) -> HTMLResponse:
             """Render main overview page."""
             try:
                 # Get version information
-                from src.core.version import get_version_info
-
                 version_info = get_version_info()
 
                 # Get current state for template
@@ -161,19 +239,13 @@ class WebApp:
                 # Get capabilities for template
                 capabilities = {}
                 if self.capability_detector:
-                    for spa_id in list(
-                        self.capability_detector._capabilities_cache.keys()
-                    ):
-                        capabilities[spa_id] = (
-                            self.capability_detector.get_capability_profile(spa_id)
-                        )
+                    capabilities = (
+                        self.capability_detector.get_all_capability_profiles()
+                    )
 
                 # Load discovered items from YAML
                 discovered_items = {}
                 try:
-                    from pathlib import Path
-                    import yaml
-
                     yaml_path = Path(self.config.config_dir) / "discovered_items.yaml"
                     if yaml_path.exists():
                         with open(yaml_path, "r") as f:
@@ -192,7 +264,7 @@ class WebApp:
                         "discovered_items": discovered_items,
                         "config": self.config,
                         "versions": version_info,
-                        "last_updated": datetime.now(timezone.utc).isoformat(),
+                        "last_updated": self._now(),
                     },
                 )
             except Exception as e:
@@ -206,7 +278,7 @@ class WebApp:
             """Health check endpoint."""
             return {
                 "status": "healthy",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": self._now(),
             }
 
         @self.app.get("/api/errors", response_model=Dict[str, Any])
@@ -218,13 +290,13 @@ class WebApp:
                     subsystems = self.error_tracker.get_subsystem_status()
 
                     return {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "summary": summary,
                         "subsystems": subsystems,
                     }
                 else:
                     return {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "summary": {
                             "total_errors": 0,
                             "critical_count": 0,
@@ -250,14 +322,11 @@ class WebApp:
                 category = data.get("category")
 
                 if self.error_tracker:
-                    # Import ErrorCategory if available
                     try:
-                        from src.core.error_tracker import ErrorCategory
-
                         cat_filter = (
                             ErrorCategory[category.upper()] if category else None
                         )
-                    except (ImportError, KeyError, AttributeError):
+                    except (KeyError, AttributeError):
                         cat_filter = None
 
                     cleared = self.error_tracker.clear_errors(cat_filter)
@@ -265,7 +334,7 @@ class WebApp:
                     return {
                         "status": "success",
                         "cleared_count": cleared,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                     }
                 else:
                     raise HTTPException(
@@ -287,13 +356,13 @@ class WebApp:
                     progress = self.progress_tracker.get_progress()
 
                     return {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "progress": progress,
                         "available": True,
                     }
                 else:
                     return {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "progress": {},
                         "available": False,
                         "message": "Progress tracker not available",
@@ -313,7 +382,7 @@ class WebApp:
 
                     if spa_progress:
                         return {
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                            "timestamp": self._now(),
                             "spa_progress": spa_progress,
                             "available": True,
                         }
@@ -333,182 +402,101 @@ class WebApp:
                     status_code=500, detail=f"Failed to get spa progress: {str(e)}"
                 )
 
-        # Command endpoints
-        @self.app.post("/api/commands/set_temperature")
-        async def set_temperature(request: Request) -> Dict[str, Any]:
-            """Set spa target temperature."""
-            try:
-                data = await request.json()
-                temperature = data.get("temperature")
-
-                if temperature is None:
-                    raise HTTPException(
-                        status_code=400, detail="Temperature value required"
-                    )
-
-                if self.smarttub_client:
-                    await self.smarttub_client.set_temperature(float(temperature))
-                    return {
-                        "status": "success",
-                        "message": f"Temperature set to {temperature}°C",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=503, detail="SmartTub client not available"
-                    )
-
-            except ValueError as e:
+        # Command endpoints. Request bodies are parsed and validated by
+        # FastAPI against the command models; a missing client is a 503.
+        def require_client() -> SmartTubClient:
+            """Dependency returning the SmartTub client."""
+            if not self.smarttub_client:
                 raise HTTPException(
-                    status_code=400, detail=f"Invalid temperature value: {str(e)}"
+                    status_code=503, detail="SmartTub client not available"
                 )
+            return self.smarttub_client
+
+        async def run_command(
+            action: str, command: Callable[[], Awaitable[None]], message: str
+        ) -> Dict[str, Any]:
+            """Run a client command and build the success response."""
+            try:
+                await command()
             except Exception as e:
                 raise HTTPException(
-                    status_code=500, detail=f"Failed to set temperature: {str(e)}"
+                    status_code=500, detail=f"Failed to {action}: {str(e)}"
                 )
+            return {"status": "success", "message": message, "timestamp": self._now()}
+
+        @self.app.post("/api/commands/set_temperature")
+        async def set_temperature(
+            body: TemperatureCommand,
+            client: SmartTubClient = Depends(require_client),
+        ) -> Dict[str, Any]:
+            """Set spa target temperature."""
+            return await run_command(
+                "set temperature",
+                lambda: client.set_temperature(body.temperature),
+                f"Temperature set to {body.temperature}°C",
+            )
 
         @self.app.post("/api/commands/set_heat_mode")
-        async def set_heat_mode(request: Request) -> Dict[str, Any]:
+        async def set_heat_mode(
+            body: HeatModeCommand,
+            client: SmartTubClient = Depends(require_client),
+        ) -> Dict[str, Any]:
             """Set spa heating mode."""
-            try:
-                data = await request.json()
-                mode = data.get("mode")
-
-                if mode is None:
-                    raise HTTPException(status_code=400, detail="Mode value required")
-
-                if self.smarttub_client:
-                    await self.smarttub_client.set_heat_mode(str(mode))
-                    return {
-                        "status": "success",
-                        "message": f"Heat mode set to {mode}",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=503, detail="SmartTub client not available"
-                    )
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Failed to set heat mode: {str(e)}"
-                )
+            return await run_command(
+                "set heat mode",
+                lambda: client.set_heat_mode(body.mode),
+                f"Heat mode set to {body.mode}",
+            )
 
         @self.app.post("/api/commands/set_pump_state")
-        async def set_pump_state(request: Request) -> Dict[str, Any]:
+        async def set_pump_state(
+            body: StateCommand,
+            client: SmartTubClient = Depends(require_client),
+        ) -> Dict[str, Any]:
             """Set pump state."""
-            try:
-                data = await request.json()
-                state = data.get("state")
-
-                if state is None:
-                    raise HTTPException(status_code=400, detail="State value required")
-
-                if self.smarttub_client:
-                    enabled = state.lower() == "on"
-                    await self.smarttub_client.set_pump_state(enabled)
-                    return {
-                        "status": "success",
-                        "message": f"Pump {'started' if enabled else 'stopped'}",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=503, detail="SmartTub client not available"
-                    )
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Failed to set pump state: {str(e)}"
-                )
+            enabled = body.state.lower() == "on"
+            return await run_command(
+                "set pump state",
+                lambda: client.set_pump_state(enabled),
+                f"Pump {'started' if enabled else 'stopped'}",
+            )
 
         @self.app.post("/api/commands/set_light_state")
-        async def set_light_state(request: Request) -> Dict[str, Any]:
+        async def set_light_state(
+            body: StateCommand,
+            client: SmartTubClient = Depends(require_client),
+        ) -> Dict[str, Any]:
             """Set light state."""
-            try:
-                data = await request.json()
-                state = data.get("state")
-
-                if state is None:
-                    raise HTTPException(status_code=400, detail="State value required")
-
-                if self.smarttub_client:
-                    enabled = state.lower() == "on"
-                    await self.smarttub_client.set_light_state(enabled)
-                    return {
-                        "status": "success",
-                        "message": f"Light {'turned on' if enabled else 'turned off'}",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=503, detail="SmartTub client not available"
-                    )
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Failed to set light state: {str(e)}"
-                )
+            enabled = body.state.lower() == "on"
+            return await run_command(
+                "set light state",
+                lambda: client.set_light_state(enabled),
+                f"Light {'turned on' if enabled else 'turned off'}",
+            )
 
         @self.app.post("/api/commands/set_light_color")
-        async def set_light_color(request: Request) -> Dict[str, Any]:
+        async def set_light_color(
+            body: LightColorCommand,
+            client: SmartTubClient = Depends(require_client),
+        ) -> Dict[str, Any]:
             """Set light color."""
-            try:
-                data = await request.json()
-                color = data.get("color")
-
-                if color is None:
-                    raise HTTPException(status_code=400, detail="Color value required")
-
-                if self.smarttub_client:
-                    await self.smarttub_client.set_light_color(str(color))
-                    return {
-                        "status": "success",
-                        "message": f"Light color set to {color}",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=503, detail="SmartTub client not available"
-                    )
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Failed to set light color: {str(e)}"
-                )
+            return await run_command(
+                "set light color",
+                lambda: client.set_light_color(body.color),
+                f"Light color set to {body.color}",
+            )
 
         @self.app.post("/api/commands/set_light_brightness")
-        async def set_light_brightness(request: Request) -> Dict[str, Any]:
+        async def set_light_brightness(
+            body: LightBrightnessCommand,
+            client: SmartTubClient = Depends(require_client),
+        ) -> Dict[str, Any]:
             """Set light brightness."""
-            try:
-                data = await request.json()
-                brightness = data.get("brightness")
-
-                if brightness is None:
-                    raise HTTPException(
-                        status_code=400, detail="Brightness value required"
-                    )
-
-                if self.smarttub_client:
-                    await self.smarttub_client.set_light_brightness(int(brightness))
-                    return {
-                        "status": "success",
-                        "message": f"Light brightness set to {brightness}%",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                else:
-                    raise HTTPException(
-                        status_code=503, detail="SmartTub client not available"
-                    )
-
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid brightness value: {str(e)}"
-                )
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500, detail=f"Failed to set light brightness: {str(e)}"
-                )
+            return await run_command(
+                "set light brightness",
+                lambda: client.set_light_brightness(int(body.brightness)),
+                f"Light brightness set to {body.brightness}%",
+            )
 
         @self.app.get("/api/commands/history")
         async def get_command_history() -> Dict[str, Any]:
@@ -518,7 +506,7 @@ class WebApp:
             return {
                 "commands": [
                     {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": self._now(),
                         "command": "system_startup",
                         "status": "success",
                         "message": "System initialized",
@@ -664,7 +652,7 @@ class WebApp:
                 )
 
         @self.app.get("/discovery", response_class=HTMLResponse)
-        async def discovery_page(request: Request) -> HTMLResponse:
+        def discovery_page(request: Request) -> HTMLResponse:
             """Render discovery page."""
             try:
                 return self.templates.TemplateResponse(
@@ -676,18 +664,15 @@ class WebApp:
                 )
 
         @self.app.get("/controls", response_class=HTMLResponse)
-        async def controls(request: Request) -> HTMLResponse:
+        def controls(request: Request) -> HTMLResponse:
             """Render controls page."""
             try:
                 # Get capabilities for template
                 capabilities = {}
                 if self.capability_detector:
-                    for spa_id in list(
-                        self.capability_detector._capabilities_cache.keys()
-                    ):
-                        capabilities[spa_id] = (
-                            self.capability_detector.get_capability_profile(spa_id)
-                        )
+                    capabilities = (
+                        self.capability_detector.get_all_capability_profiles()
+                    )
 
                 return self.templates.TemplateResponse(
                     "controls.html",
@@ -2,95 +2,121 @@
 
 from __future__ import annotations
 
+import base64
 import secrets
 from typing import Optional
 
-from fastapi import HTTPException, Request, status
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from fastapi import status
+from fastapi.responses import JSONResponse
+from fastapi.security import HTTPBasicCredentials
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 class BasicAuthMiddleware:
-    """Middleware to enforce HTTP Basic Authentication on all routes."""
+    """ASGI middleware to enforce HTTP Basic Authentication on all routes."""
 
-    def __init__(self, username: str, password: str):
+    def __init__(self, app: ASGIApp, username: str, password: str):
         """Initialize Basic Auth middleware.
 
         Args:
+            app: Wrapped ASGI application
             username: Required username
             password: Required password
         """
+        self.app = app
         self.username = username
         self.password = password
-        self.security = HTTPBasic()
+        self._username_bytes = username.encode("utf-8")
+        self._password_bytes = password.encode("utf-8")
+        # Exact header a well-behaved client sends; lets the common case
+        # succeed with a single comparison and no decoding.
+        self._expected_header = b"Basic " + base64.b64encode(
+            f"{username}:{password}".encode("utf-8")
+        )
 
-    async def __call__(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and enforce authentication.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            Response from next handler
-
-        Raises:
-            HTTPException: 401 if authentication fails
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip auth for health check endpoint
-        if request.url.path == "/health":
-            return await call_next(request)
-
-        # Get credentials from Authorization header
-        credentials = await self._get_credentials(request)
+        # Only HTTP requests are authenticated; lifespan passes through.
+        # Skip auth for health check endpoint.
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
+
+        # Get raw Authorization header (ASGI header names are lowercase)
+        authorization = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+
+        # Fast path: compare the raw header against the precomputed value
+        if secrets.compare_digest(authorization, self._expected_header):
+            await self.app(scope, receive, send)
+            return
+
+        credentials = self._get_credentials(authorization)
 
         if not credentials:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authentication required",
-                headers={"WWW-Authenticate": "Basic"},
-            )
+            await self._reject("Authentication required", scope, receive, send)
+            return
 
         # Verify credentials using constant-time comparison
         username_correct = secrets.compare_digest(
-            credentials.username.encode("utf-8"), self.username.encode("utf-8")
+            credentials.username.encode("utf-8"), self._username_bytes
         )
         password_correct = secrets.compare_digest(
-            credentials.password.encode("utf-8"), self.password.encode("utf-8")
+            credentials.password.encode("utf-8"), self._password_bytes
         )
 
         if not (username_correct and password_correct):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid credentials",
-                headers={"WWW-Authenticate": "Basic"},
-            )
+            await self._reject("Invalid credentials", scope, receive, send)
+            return
 
         # Authentication successful, proceed to handler
-        return await call_next(request)
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(detail: str, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send a 401 response asking the client for Basic credentials.
 
-    async def _get_credentials(
-        self, request: Request
-    ) -> Optional[HTTPBasicCredentials]:
+        Args:
+            detail: Error detail for the response body
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        response = JSONResponse(
+            {"detail": detail},
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Basic"},
+        )
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _get_credentials(authorization: bytes) -> Optional[HTTPBasicCredentials]:
         """Extract credentials from Authorization header.
 
         Args:
-            request: HTTP request
+            authorization: Raw Authorization header value
 
         Returns:
             HTTPBasicCredentials if header present, None otherwise
         """
-        authorization = request.headers.get("Authorization")
         if not authorization:
             return None
 
         try:
-            scheme, credentials = authorization.split(" ", 1)
-            if scheme.lower() != "basic":
+            scheme, credentials = authorization.split(b" ", 1)
+            if scheme.lower() != b"basic":
                 return None
 
             # Decode base64 credentials
-            import base64
-
             decoded = base64.b64decode(credentials).decode("utf-8")
             username, password = decoded.split(":", 1)
 